@@ -1,5 +1,14 @@
 from django.contrib import admin
-from .models import Application, Attachment, StatusHistory, Reminder
+from .models import (
+    Application,
+    ArchivedReminder,
+    Attachment,
+    AttachmentBlob,
+    DashboardRollup,
+    ImportJob,
+    StatusHistory,
+    Reminder,
+)
 
 
 @admin.register(Application)
@@ -16,13 +25,63 @@ class AttachmentAdmin(admin.ModelAdmin):
     list_filter = ["doc_type", "uploaded_at"]
 
 
+@admin.register(AttachmentBlob)
+class AttachmentBlobAdmin(admin.ModelAdmin):
+    list_display = ["sha256", "size", "ref_count", "created_at"]
+    readonly_fields = [
+        "sha256",
+        "file",
+        "size",
+        "ref_count",
+        "created_at",
+        "updated_at",
+    ]
+
+
 @admin.register(StatusHistory)
 class StatusHistoryAdmin(admin.ModelAdmin):
-    list_display = ["application", "from_status", "to_status", "changed_by", "timestamp"]
+    list_display = [
+        "application",
+        "from_status",
+        "to_status",
+        "changed_by",
+        "timestamp",
+    ]
     list_filter = ["timestamp"]
 
 
 @admin.register(Reminder)
 class ReminderAdmin(admin.ModelAdmin):
     list_display = ["application", "remind_at", "channel", "is_sent", "created_at"]
-    list_filter = ["is_sent", "channel", "remind_at"]
\ No newline at end of file
+    list_filter = ["is_sent", "channel", "remind_at"]
+
+
+@admin.register(ArchivedReminder)
+class ArchivedReminderAdmin(admin.ModelAdmin):
+    list_display = ["application", "remind_at", "channel", "archived_at"]
+    list_filter = ["archived_at"]
+
+
+@admin.register(DashboardRollup)
+class DashboardRollupAdmin(admin.ModelAdmin):
+    list_display = ["owner", "total", "updated_at"]
+    readonly_fields = [
+        "owner",
+        "total",
+        "status_counts",
+        "submissions_by_day",
+        "updated_at",
+    ]
+
+
+@admin.register(ImportJob)
+class ImportJobAdmin(admin.ModelAdmin):
+    list_display = [
+        "owner",
+        "status",
+        "processed_rows",
+        "created_count",
+        "error_count",
+        "created_at",
+    ]
+    list_filter = ["status", "created_at"]
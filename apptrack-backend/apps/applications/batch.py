@@ -0,0 +1,143 @@
+"""
+Bulk create/update/delete of a user's applications.
+
+Every operation is validated with ``ApplicationDetailSerializer`` first;
+the valid ones are then written in one transaction with one statement per
+kind of write, and each operation gets its own result entry.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Application, StatusHistory, Tombstone
+from .rollups import apply_changes, snapshot
+from .serializers import ApplicationDetailSerializer
+from .signals import invalidate_owner_cache
+
+
+def _result(index, op, result_status, application_id=None, errors=None):
+    result = {"index": index, "op": op, "status": result_status}
+    if application_id is not None:
+        result["id"] = str(application_id)
+    if errors is not None:
+        result["errors"] = errors
+    return result
+
+
+@transaction.atomic
+def apply_batch(request, operations):
+    user = request.user
+    context = {"request": request}
+    results = [None] * len(operations)
+
+    target_ids = [op["id"] for op in operations if op["op"] != "create"]
+    # Validation and writes share one transaction and the target rows stay
+    # locked throughout, so a concurrent write can't be lost or leave a stale
+    # StatusHistory.from_status; lock in pk order to avoid deadlocks
+    existing = {
+        app.pk: app
+        for app in Application.objects.select_for_update()
+        .filter(owner=user, pk__in=target_ids)
+        .order_by("pk")
+    }
+
+    creates, updates, deletes = [], [], []
+    seen = set()
+    for index, operation in enumerate(operations):
+        op = operation["op"]
+        application_id = operation.get("id")
+
+        if op != "create":
+            if application_id in seen:
+                results[index] = _result(
+                    index,
+                    op,
+                    "error",
+                    application_id,
+                    {"id": ["Duplicate id in batch."]},
+                )
+                continue
+            seen.add(application_id)
+            if application_id not in existing:
+                results[index] = _result(
+                    index, op, "error", application_id, {"id": ["Not found."]}
+                )
+                continue
+
+        if op == "delete":
+            deletes.append((index, existing[application_id]))
+            continue
+
+        if op == "create":
+            serializer = ApplicationDetailSerializer(
+                data=operation.get("data", {}), context=context
+            )
+        else:
+            serializer = ApplicationDetailSerializer(
+                existing[application_id],
+                data=operation.get("data", {}),
+                partial=True,
+                context=context,
+            )
+        if not serializer.is_valid():
+            results[index] = _result(
+                index, op, "error", application_id, serializer.errors
+            )
+            continue
+
+        if op == "create":
+            creates.append(
+                (index, Application(owner=user, **serializer.validated_data))
+            )
+        else:
+            updates.append((index, existing[application_id], serializer.validated_data))
+
+    changes = []
+    history = []
+    now = timezone.now()
+
+    if creates:
+        created = Application.objects.bulk_create([app for _, app in creates])
+        for (index, _), app in zip(creates, created):
+            changes.append((None, snapshot(app)))
+            results[index] = _result(index, "create", "created", app.pk)
+
+    if updates:
+        fields = {"updated_at"}
+        for index, app, validated_data in updates:
+            before = snapshot(app)
+            old_status = app.status
+            for field, value in validated_data.items():
+                setattr(app, field, value)
+                fields.add(field)
+            app.updated_at = now
+            if app.status != old_status:
+                changes.append((before, snapshot(app)))
+                history.append(
+                    StatusHistory(
+                        application=app,
+                        from_status=old_status,
+                        to_status=app.status,
+                        changed_by=user,
+                    )
+                )
+            results[index] = _result(index, "update", "updated", app.pk)
+        Application.objects.bulk_update([app for _, app, _ in updates], sorted(fields))
+        StatusHistory.objects.bulk_create(history)
+
+    if deletes:
+        Tombstone.objects.bulk_create(
+            Tombstone(owner=user, kind="application", object_id=app.pk)
+            for _, app in deletes
+        )
+        for index, app in deletes:
+            changes.append((snapshot(app), None))
+            results[index] = _result(index, "delete", "deleted", app.pk)
+        Application.objects.filter(pk__in=[app.pk for _, app in deletes]).delete()
+
+    if changes:
+        apply_changes(user.pk, changes)
+    if creates or updates or deletes:
+        # Bulk writes bypass the model signals
+        invalidate_owner_cache(user.pk)
+
+    return results
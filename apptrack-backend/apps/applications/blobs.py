@@ -0,0 +1,62 @@
+"""
+Content-addressed attachment storage.
+
+Uploads are hashed with SHA-256 while streaming through them, and each
+distinct content is stored once as an ``AttachmentBlob``. Attachments
+point at the shared blob (and carry its storage name in ``file``, so
+URLs keep working), and the blob's ``ref_count`` tracks how many do.
+"""
+import hashlib
+
+from django.db.models import F
+from django.utils import timezone
+
+from .models import AttachmentBlob
+
+
+def hash_file(file):
+    digest = hashlib.sha256()
+    for chunk in file.chunks():
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def acquire_blob(file, filename=None):
+    """
+    Return the blob holding ``file``'s contents with one more reference.
+
+    Stores the contents if no blob has them yet. Call inside a transaction
+    together with the write of the referencing attachment.
+    """
+    digest = hash_file(file)
+    acquired = AttachmentBlob.objects.filter(pk=digest).update(
+        ref_count=F("ref_count") + 1, updated_at=timezone.now()
+    )
+    if not acquired:
+        blob = AttachmentBlob(sha256=digest, size=file.size, ref_count=1)
+        field = AttachmentBlob._meta.get_field("file")
+        # Never adopts an existing file at that path: it may be an orphan
+        # the garbage collector is about to delete
+        blob.file.name = field.storage.save(
+            field.generate_filename(blob, filename or file.name), file
+        )
+        # Another upload of the same content may have won the race
+        blob, created = AttachmentBlob.objects.get_or_create(
+            sha256=digest,
+            defaults={"file": blob.file.name, "size": blob.size, "ref_count": 1},
+        )
+        if not created:
+            AttachmentBlob.objects.filter(pk=digest).update(
+                ref_count=F("ref_count") + 1, updated_at=timezone.now()
+            )
+        return blob
+    return AttachmentBlob.objects.get(pk=digest)
+
+
+def release_blob(blob_id):
+    """Drop one reference; unreferenced blobs are collected later."""
+    if blob_id is not None:
+        AttachmentBlob.objects.filter(pk=blob_id, ref_count__gt=0).update(
+            ref_count=F("ref_count") - 1, updated_at=timezone.now()
+        )
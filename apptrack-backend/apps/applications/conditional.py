@@ -0,0 +1,63 @@
+"""
+Validators for conditional GETs on the application list and dashboard.
+
+Both are derived from one indexed aggregate over the user's applications,
+so an unchanged reload is answered with 304 before any serializer runs.
+Row count catches deletes for ETags; the rollup row's ``updated_at`` (it is
+written in the same transaction as every create, delete and status change)
+catches them for ``If-Modified-Since``.
+"""
+import hashlib
+from datetime import datetime, time
+from urllib.parse import urlencode
+
+from django.db.models import Count, Max, Subquery
+from django.db.models.functions import Coalesce, Greatest
+from django.utils import timezone
+
+from .models import Application, DashboardRollup
+
+
+def application_state(request):
+    if not hasattr(request, "_application_state"):
+        rollup_updated_at = DashboardRollup.objects.filter(owner=request.user).values(
+            "updated_at"
+        )[:1]
+        request._application_state = Application.objects.filter(
+            owner=request.user
+        ).aggregate(
+            count=Count("id"),
+            # Greatest() is NULL on SQLite/MySQL if any argument is, and a
+            # user has no rollup row until their first write
+            last_modified=Greatest(
+                Max("updated_at"),
+                Coalesce(Subquery(rollup_updated_at), Max("updated_at")),
+            ),
+        )
+    return request._application_state
+
+
+def _etag(request, *extra):
+    state = application_state(request)
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    parts = [request.path, query, state["count"], state["last_modified"], *extra]
+    return hashlib.md5("|".join(map(str, parts)).encode()).hexdigest()
+
+
+def applications_etag(request, *args, **kwargs):
+    return _etag(request)
+
+
+def applications_last_modified(request, *args, **kwargs):
+    return application_state(request)["last_modified"]
+
+
+def dashboard_etag(request, *args, **kwargs):
+    # Upcoming deadlines shift with the date even when no row changes
+    return _etag(request, timezone.localdate())
+
+
+def dashboard_last_modified(request, *args, **kwargs):
+    last_modified = application_state(request)["last_modified"]
+    today = timezone.make_aware(datetime.combine(timezone.localdate(), time.min))
+    return max(last_modified, today) if last_modified else today
@@ -0,0 +1,146 @@
+"""
+Daily reminder digests for users who opt into ``reminder_delivery="digest"``.
+
+The digest task runs hourly. Each run picks the digest users whose local
+time (in their own ``timezone``) has reached their ``digest_hour`` and who
+have not had today's digest yet, loads their due reminders and upcoming
+deadlines with one aggregated query per batch of users, and sends each
+user a single email over one mail connection.
+"""
+import logging
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.mail import EmailMessage, get_connection
+from django.db.models import Count, Q
+
+from .models import Application, Reminder
+from .signals import invalidate_owner_cache
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+def digest_users(now):
+    """Digest users due for today's digest, as ``{user_id: local_date}``."""
+    candidates = User.objects.filter(reminder_delivery="digest", is_active=True)
+    due = Q(pk__in=[])
+    local_dates = {}
+    # order_by() drops User.Meta.ordering, which would otherwise make
+    # DISTINCT return one row per user instead of one per timezone
+    zones = candidates.order_by().values_list("timezone", flat=True).distinct()
+    for name in zones:
+        try:
+            local_now = now.astimezone(ZoneInfo(name))
+        except (ZoneInfoNotFoundError, ValueError):
+            logger.error(f"Skipping digests for unknown timezone {name!r}")
+            continue
+        local_midnight = datetime.combine(local_now.date(), time(), local_now.tzinfo)
+        due |= Q(timezone=name, digest_hour__lte=local_now.hour) & (
+            Q(last_digest_at__isnull=True) | Q(last_digest_at__lt=local_midnight)
+        )
+        local_dates[name] = local_now.date()
+
+    return {
+        user_id: local_dates[name]
+        for user_id, name in candidates.filter(due).values_list("pk", "timezone")
+    }
+
+
+def collect_digest_items(local_dates, now):
+    """
+    Return ``{user_id: (reminders, deadlines)}`` from one query.
+
+    ``reminders`` are applications with due unsent reminders; ``deadlines``
+    are applications whose deadline falls within the next
+    ``DIGEST_DEADLINE_DAYS`` days of the user's local date.
+    """
+    window = timedelta(days=settings.DIGEST_DEADLINE_DAYS)
+    first_day = min(local_dates.values())
+    last_day = max(local_dates.values()) + window
+
+    rows = (
+        Application.objects.filter(owner_id__in=local_dates)
+        .annotate(
+            due_reminders=Count(
+                "reminders",
+                filter=Q(reminders__is_sent=False, reminders__remind_at__lte=now),
+            )
+        )
+        .filter(Q(due_reminders__gt=0) | Q(deadline__range=(first_day, last_day)))
+        .order_by("owner_id", "deadline", "title")
+        .values(
+            "owner_id", "title", "organization", "status", "deadline", "due_reminders"
+        )
+    )
+
+    items = defaultdict(lambda: ([], []))
+    for row in rows:
+        owner_id = row["owner_id"]
+        today = local_dates[owner_id]
+        reminders, deadlines = items[owner_id]
+        if row["due_reminders"]:
+            reminders.append(row)
+        if row["deadline"] and today <= row["deadline"] <= today + window:
+            deadlines.append(row)
+    return {owner_id: lists for owner_id, lists in items.items() if any(lists)}
+
+
+def _describe(row):
+    statuses = dict(Application.STATUS_CHOICES)
+    return f"{row['title']} at {row['organization']} ({statuses[row['status']]})"
+
+
+def build_digest(user, local_date, reminders, deadlines, connection=None):
+    lines = [f"Hi {user.first_name},", "", f"Your AppTrack digest for {local_date}:"]
+    if reminders:
+        lines += ["", "Reminders:"]
+        lines += [f"  - {_describe(row)}" for row in reminders]
+    if deadlines:
+        lines += ["", "Upcoming deadlines:"]
+        lines += [f"  - {row['deadline']}: {_describe(row)}" for row in deadlines]
+    lines += ["", "Best regards,", "AppTrack Team"]
+
+    return EmailMessage(
+        f"Your AppTrack digest for {local_date}",
+        "\n".join(lines),
+        settings.DEFAULT_FROM_EMAIL,
+        [user.email],
+        connection=connection,
+    )
+
+
+def send_digests(local_dates, now):
+    """Send one batch of digests; returns the number of emails sent."""
+    items = collect_digest_items(local_dates, now)
+    users = User.objects.in_bulk(list(items))
+
+    sent = []
+    with get_connection() as connection:
+        for user_id, (reminders, deadlines) in items.items():
+            message = build_digest(
+                users[user_id], local_dates[user_id], reminders, deadlines, connection
+            )
+            try:
+                connection.send_messages([message])
+            except Exception as exc:
+                logger.error(f"Error sending digest to user {user_id}: {exc}")
+                continue
+            sent.append(user_id)
+
+    if sent:
+        Reminder.objects.filter(
+            application__owner_id__in=sent, is_sent=False, remind_at__lte=now
+        ).update(is_sent=True, updated_at=now)
+        # Bulk writes bypass the model signals
+        for user_id in sent:
+            invalidate_owner_cache(user_id)
+
+    # Users with nothing to report are done for today as well
+    done = set(sent) | (set(local_dates) - set(items))
+    User.objects.filter(pk__in=done).update(last_digest_at=now)
+    return len(sent)
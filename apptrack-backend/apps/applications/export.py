@@ -0,0 +1,100 @@
+"""
+Streaming CSV / NDJSON export of a user's applications.
+
+Rows are read with a server-side cursor through ``values().iterator()`` and
+written to the response one at a time, so memory stays flat no matter how
+many applications a user has.
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from .models import StatusHistory
+
+EXPORT_FIELDS = [
+    "id",
+    "kind",
+    "title",
+    "organization",
+    "location_country",
+    "source_url",
+    "applied_date",
+    "deadline",
+    "status",
+    "priority",
+    "notes",
+    "tags",
+    "attachments_count",
+    "created_at",
+    "updated_at",
+]
+CHUNK_SIZE = 2000
+
+
+class PassthroughRenderer(BaseRenderer):
+    """
+    Lets DRF negotiate ``?format=`` for views that stream their own body.
+
+    Streamed responses never reach ``render``; only error responses (auth,
+    throttling, unknown format) do, and those are rendered as JSON.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get("response")
+        if response is not None:
+            response["Content-Type"] = JSONRenderer.media_type
+        return JSONRenderer().render(data)
+
+
+class CSVRenderer(PassthroughRenderer):
+    media_type = "text/csv"
+    format = "csv"
+
+
+class NDJSONRenderer(PassthroughRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class Echo:
+    """File-like object whose write() returns the line for streaming."""
+
+    def write(self, value):
+        return value
+
+
+def export_rows(queryset, include_history_count=False):
+    fields = list(EXPORT_FIELDS)
+    if include_history_count:
+        history_count = (
+            StatusHistory.objects.filter(application=OuterRef("pk"))
+            .order_by()
+            .values("application")
+            .annotate(total=Count("id"))
+            .values("total")
+        )
+        queryset = queryset.annotate(
+            history_count=Coalesce(
+                Subquery(history_count, output_field=IntegerField()), 0
+            )
+        )
+        fields.append("history_count")
+    rows = queryset.values(*fields).iterator(chunk_size=CHUNK_SIZE)
+    return fields, rows
+
+
+def stream_csv(fields, rows):
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+    for row in rows:
+        row["tags"] = ";".join(row["tags"] or [])
+        yield writer.writerow([row[field] for field in fields])
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
@@ -0,0 +1,180 @@
+"""
+Garbage collection of attachment files nobody references any more.
+
+Two passes, both limited to files untouched for ``ATTACHMENT_GC_GRACE_HOURS``
+so uploads still in flight are never collected:
+
+1. Blobs whose ``ref_count`` dropped to zero are locked, re-checked and
+   deleted together with their file, in batches. A blob whose count
+   drifted to zero while attachments still point at it gets its count
+   repaired instead.
+2. Storage under ``attachments/`` is walked in batches and compared with
+   the set of live ``Attachment.file``/``AttachmentBlob.file`` names
+   (built in chunks). Files in neither are deleted: legacy files whose
+   attachment was deleted, and leftovers of rolled-back uploads. Files
+   that disappear during the walk are skipped.
+
+Both passes honour ``dry_run`` and report their counts.
+"""
+import logging
+import posixpath
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
+
+from .models import Attachment, AttachmentBlob
+
+logger = logging.getLogger(__name__)
+
+STORAGE_ROOT = "attachments"
+
+
+def gc_cutoff():
+    return timezone.now() - timedelta(hours=settings.ATTACHMENT_GC_GRACE_HOURS)
+
+
+def collect_unreferenced_blobs(storage, cutoff, batch_size, dry_run, metrics):
+    last_pk = ""
+    while True:
+        with transaction.atomic():
+            batch = list(
+                AttachmentBlob.objects.filter(
+                    ref_count=0, updated_at__lt=cutoff, pk__gt=last_pk
+                )
+                .select_for_update(skip_locked=True)
+                .order_by("pk")[:batch_size]
+            )
+            if not batch:
+                return
+            last_pk = batch[-1].pk
+            # Attachment.blob is PROTECT: a drifted ref_count must not
+            # make us delete (or fail on) a blob that is still in use
+            in_use = dict(
+                Attachment.objects.filter(blob__in=batch)
+                .order_by()
+                .values("blob")
+                .annotate(total=Count("id"))
+                .values_list("blob", "total")
+            )
+            batch = [blob for blob in batch if blob.pk not in in_use]
+            metrics["blobs_repaired"] += len(in_use)
+            metrics["blobs_unreferenced"] += len(batch)
+            if dry_run:
+                continue
+            for pk, total in in_use.items():
+                AttachmentBlob.objects.filter(pk=pk).update(ref_count=total)
+            AttachmentBlob.objects.filter(pk__in=[blob.pk for blob in batch]).delete()
+            # Files go only once the rows are gone; a concurrent upload of
+            # the same content then stores a fresh copy
+            for blob in batch:
+                transaction.on_commit(partial(storage.delete, blob.file.name))
+            metrics["blobs_deleted"] += len(batch)
+            metrics["bytes_freed"] += sum(blob.size for blob in batch)
+
+
+def walk_storage(storage, root):
+    """Yield every file name under ``root``, one directory at a time."""
+    directories = [root]
+    while directories:
+        directory = directories.pop()
+        try:
+            subdirectories, files = storage.listdir(directory)
+        except FileNotFoundError:
+            continue
+        directories += [posixpath.join(directory, name) for name in subdirectories]
+        for name in files:
+            yield posixpath.join(directory, name)
+
+
+def live_file_names(chunk_size):
+    live = set()
+    for model in (Attachment, AttachmentBlob):
+        names = model.objects.order_by().values_list("file", flat=True)
+        live.update(names.iterator(chunk_size=chunk_size))
+    return live
+
+
+def referenced(names):
+    """Of ``names``, those a row points at right now."""
+    return set(
+        Attachment.objects.filter(file__in=names).values_list("file", flat=True)
+    ) | set(
+        AttachmentBlob.objects.filter(file__in=names).values_list("file", flat=True)
+    )
+
+
+def modified_time(storage, name):
+    """``name``'s modification time, or None if it is gone."""
+    try:
+        return storage.get_modified_time(name)
+    except OSError:  # includes FileNotFoundError
+        return None
+
+
+def collect_orphaned_files(storage, cutoff, batch_size, dry_run, metrics):
+    live = live_file_names(batch_size)
+    batch = []
+
+    def sweep():
+        candidates = [name for name in batch if name not in live]
+        metrics["files_scanned"] += len(batch)
+        batch.clear()
+        modified = {name: modified_time(storage, name) for name in candidates}
+        old = [name for name, at in modified.items() if at is not None and at < cutoff]
+        metrics["files_recent"] += sum(
+            1 for at in modified.values() if at is not None and at >= cutoff
+        )
+        # Rows created since the live set was built
+        orphans = set(old) - referenced(old) if old else set()
+        metrics["files_orphaned"] += len(orphans)
+        if dry_run:
+            return
+        for name in orphans:
+            try:
+                size = storage.size(name)
+                storage.delete(name)
+            except OSError as exc:
+                logger.warning(f"Could not delete orphaned file {name}: {exc}")
+                continue
+            metrics["bytes_freed"] += size
+            metrics["files_deleted"] += 1
+
+    for name in walk_storage(storage, STORAGE_ROOT):
+        batch.append(name)
+        if len(batch) == batch_size:
+            sweep()
+    sweep()
+
+
+def collect_garbage(dry_run=False):
+    """Run both passes and return their metrics."""
+    storage = AttachmentBlob._meta.get_field("file").storage
+    cutoff = gc_cutoff()
+    batch_size = settings.ATTACHMENT_GC_BATCH_SIZE
+    metrics = dict.fromkeys(
+        [
+            "blobs_unreferenced",
+            "blobs_deleted",
+            "blobs_repaired",
+            "files_scanned",
+            "files_recent",
+            "files_orphaned",
+            "files_deleted",
+            "bytes_freed",
+        ],
+        0,
+    )
+
+    collect_unreferenced_blobs(storage, cutoff, batch_size, dry_run, metrics)
+    collect_orphaned_files(storage, cutoff, batch_size, dry_run, metrics)
+
+    logger.info(
+        "Attachment GC%s: %s",
+        " (dry run)" if dry_run else "",
+        ", ".join(f"{key}={value}" for key, value in metrics.items()),
+    )
+    return metrics
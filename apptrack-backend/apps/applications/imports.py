@@ -0,0 +1,109 @@
+"""
+Bulk import of applications from an uploaded CSV.
+
+The file is read as a stream and handled in batches: each row is validated
+with ``ApplicationDetailSerializer``, duplicates (same kind, title and
+organization as an existing or earlier row) are skipped, and each batch is
+written with one ``bulk_create`` in its own transaction. Progress is saved
+on the ``ImportJob`` after every batch so the client can poll it.
+"""
+import csv
+import io
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Application, ImportJob
+from .rollups import apply_changes, snapshot
+from .serializers import ApplicationDetailSerializer
+from .signals import invalidate_owner_cache
+
+
+def dedupe_key(kind, title, organization):
+    return (kind, title.strip().lower(), organization.strip().lower())
+
+
+def parse_row(row):
+    """Drop blank cells so optional fields fall back to their defaults."""
+    data = {
+        key: value.strip()
+        for key, value in row.items()
+        if key and isinstance(value, str) and value.strip()
+    }
+    if "tags" in data:
+        data["tags"] = [tag.strip() for tag in data["tags"].split(";") if tag.strip()]
+    return data
+
+
+def _write_batch(job, batch):
+    with transaction.atomic():
+        created = Application.objects.bulk_create(batch)
+        apply_changes(job.owner_id, [(None, snapshot(app)) for app in created])
+        invalidate_owner_cache(job.owner_id)
+    return len(created)
+
+
+def run_import(job):
+    job.status = "running"
+    job.started_at = timezone.now()
+    job.save(update_fields=["status", "started_at"])
+
+    seen = {
+        dedupe_key(*values)
+        for values in Application.objects.filter(owner_id=job.owner_id).values_list(
+            "kind", "title", "organization"
+        )
+    }
+    batch = []
+
+    def record_progress():
+        nonlocal batch
+        if batch:
+            job.created_count += _write_batch(job, batch)
+            batch = []
+        job.save(
+            update_fields=[
+                "processed_rows",
+                "created_count",
+                "duplicate_count",
+                "error_count",
+                "errors",
+            ]
+        )
+
+    with job.file.open("rb") as raw:
+        reader = csv.DictReader(io.TextIOWrapper(raw, encoding="utf-8-sig"))
+        # Row 1 is the header
+        for line, row in enumerate(reader, start=2):
+            job.processed_rows += 1
+            serializer = ApplicationDetailSerializer(data=parse_row(row))
+            if not serializer.is_valid():
+                job.error_count += 1
+                if len(job.errors) < settings.IMPORT_MAX_ERRORS:
+                    job.errors.append({"row": line, "errors": serializer.errors})
+            else:
+                data = serializer.validated_data
+                key = dedupe_key(data["kind"], data["title"], data["organization"])
+                if key in seen:
+                    job.duplicate_count += 1
+                else:
+                    seen.add(key)
+                    batch.append(Application(owner_id=job.owner_id, **data))
+
+            if job.processed_rows % settings.IMPORT_BATCH_SIZE == 0:
+                record_progress()
+
+    record_progress()
+    job.status = "completed"
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "finished_at"])
+    return job
+
+
+def fail_import(job_id, exc):
+    job = ImportJob.objects.get(pk=job_id)
+    job.status = "failed"
+    job.finished_at = timezone.now()
+    job.errors.append({"row": None, "errors": {"file": [str(exc)]}})
+    job.save(update_fields=["status", "finished_at", "errors"])
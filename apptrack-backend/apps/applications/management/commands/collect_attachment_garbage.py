@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand
+
+from apps.applications.garbage import collect_garbage
+
+
+class Command(BaseCommand):
+    help = "Delete unreferenced attachment blobs and orphaned attachment files."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would be deleted without deleting anything.",
+        )
+
+    def handle(self, *args, **options):
+        metrics = collect_garbage(dry_run=options["dry_run"])
+        for key, value in metrics.items():
+            self.stdout.write(f"{key}: {value}")
+        if not options["dry_run"]:
+            self.stdout.write(self.style.SUCCESS("Attachment garbage collected"))
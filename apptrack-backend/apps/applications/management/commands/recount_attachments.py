@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.applications.models import Application, Attachment
+
+
+def actual_attachments_count():
+    counts = (
+        Attachment.objects.filter(application=OuterRef("pk"))
+        .order_by()
+        .values("application")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfill or repair Application.attachments_count from the attachments "
+        "table."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report drifted applications without updating them.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = (
+            Application.objects.annotate(actual=actual_attachments_count())
+            .exclude(attachments_count=F("actual"))
+            .values_list("pk", flat=True)
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(f"{drifted.count()} applications have a drifted count")
+            return
+
+        updated = Application.objects.filter(pk__in=list(drifted)).update(
+            attachments_count=actual_attachments_count()
+        )
+        self.stdout.write(self.style.SUCCESS(f"Repaired {updated} applications"))
@@ -0,0 +1,95 @@
+import os
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.applications.blobs import acquire_blob
+from apps.applications.models import Attachment, AttachmentBlob
+
+
+def actual_ref_count():
+    counts = (
+        Attachment.objects.filter(blob=OuterRef("pk"))
+        .order_by()
+        .values("blob")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class Command(BaseCommand):
+    help = (
+        "Move attachments stored before content addressing onto shared blobs "
+        "and repair AttachmentBlob.ref_count."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Report what would change without touching files or rows.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Attachments migrated per query.",
+        )
+
+    def handle(self, *args, **options):
+        legacy = Attachment.objects.filter(blob__isnull=True).order_by("pk")
+        drifted = AttachmentBlob.objects.annotate(actual=actual_ref_count()).exclude(
+            ref_count=F("actual")
+        )
+
+        if options["dry_run"]:
+            self.stdout.write(f"{legacy.count()} attachments are not on a blob")
+            self.stdout.write(f"{drifted.count()} blobs have a drifted ref_count")
+            return
+
+        migrated = missing = 0
+        last_pk = None
+        while True:
+            batch = legacy if last_pk is None else legacy.filter(pk__gt=last_pk)
+            batch = list(batch[: options["batch_size"]])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+            for attachment in batch:
+                if self.migrate(attachment):
+                    migrated += 1
+                else:
+                    missing += 1
+
+        repaired = AttachmentBlob.objects.filter(
+            pk__in=list(drifted.values_list("pk", flat=True))
+        ).update(ref_count=actual_ref_count())
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Migrated {migrated} attachments, {missing} missing files, "
+                f"repaired {repaired} blob counts"
+            )
+        )
+
+    def migrate(self, attachment):
+        storage = attachment.file.storage
+        old_name = attachment.file.name
+        if not old_name or not storage.exists(old_name):
+            self.stderr.write(
+                f"Missing file for attachment {attachment.pk}: {old_name}"
+            )
+            return False
+
+        with attachment.file.open("rb") as file:
+            with transaction.atomic():
+                blob = acquire_blob(file, os.path.basename(old_name))
+                Attachment.objects.filter(pk=attachment.pk).update(
+                    blob=blob, file=blob.file.name
+                )
+        if blob.file.name != old_name:
+            storage.delete(old_name)
+        return True
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-18 17:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("applications", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["owner", "created_at", "id"],
+                name="application_owner_i_400b84_idx",
+            ),
+        ),
+    ]
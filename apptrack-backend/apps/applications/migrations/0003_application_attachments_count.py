@@ -0,0 +1,33 @@
+# Generated by Django 5.0.1 on 2026-10-18 17:50
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_attachments_count(apps, schema_editor):
+    Application = apps.get_model("applications", "Application")
+    Attachment = apps.get_model("applications", "Attachment")
+    counts = (
+        Attachment.objects.filter(application=OuterRef("pk"))
+        .order_by()
+        .values("application")
+        .annotate(total=Count("id"))
+        .values("total")
+    )
+    Application.objects.update(attachments_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("applications", "0002_application_owner_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="application",
+            name="attachments_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_attachments_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.1 on 2026-10-18 17:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("applications", "0004_dashboardrollup"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=models.Index(
+                fields=["owner", "updated_at"], name="application_owner_i_2ab6ac_idx"
+            ),
+        ),
+    ]
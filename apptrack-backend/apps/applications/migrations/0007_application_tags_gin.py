@@ -0,0 +1,23 @@
+# Generated by Django 5.0.1 on 2026-10-18 17:59
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("applications", "0006_reminder_updated_at_tombstone"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="application",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["tags"],
+                name="applications_tags_gin",
+                opclasses=["jsonb_path_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("applications", "0009_importjob"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="reminder",
+            name="claimed_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
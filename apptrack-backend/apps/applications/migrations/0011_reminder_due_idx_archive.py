@@ -0,0 +1,51 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:08
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("applications", "0010_reminder_claimed_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedReminder",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(editable=False, primary_key=True, serialize=False),
+                ),
+                ("remind_at", models.DateTimeField()),
+                (
+                    "channel",
+                    models.CharField(choices=[("email", "Email")], max_length=20),
+                ),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("archived_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "reminders_archive",
+                "ordering": ["remind_at"],
+            },
+        ),
+        migrations.AddIndex(
+            model_name="reminder",
+            index=models.Index(
+                condition=models.Q(("is_sent", False)),
+                fields=["remind_at"],
+                name="reminders_due_idx",
+            ),
+        ),
+        migrations.AddField(
+            model_name="archivedreminder",
+            name="application",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="archived_reminders",
+                to="applications.application",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("applications", "0012_attachmentblob"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="attachmentblob",
+            index=models.Index(
+                condition=models.Q(("ref_count", 0)),
+                fields=["updated_at"],
+                name="attachment_blobs_unref_idx",
+            ),
+        ),
+    ]
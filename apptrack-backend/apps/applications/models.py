@@ -1,6 +1,9 @@
 import uuid
 import os
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 from django.db import models
+from django.db.models.functions import Cast
 from django.contrib.auth import get_user_model
 from django.core.validators import URLValidator, FileExtensionValidator
 from django.core.exceptions import ValidationError
@@ -29,6 +32,16 @@ class Application(models.Model):
         ("withdrawn", "Withdrawn"),
     ]
 
+    # Allowed moves for the /transition/ endpoints
+    STATUS_TRANSITIONS = {
+        "draft": {"submitted", "withdrawn"},
+        "submitted": {"interview", "offer", "rejected", "withdrawn"},
+        "interview": {"offer", "rejected", "withdrawn"},
+        "offer": {"withdrawn"},
+        "rejected": set(),
+        "withdrawn": {"draft"},
+    }
+
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
     owner = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="applications"
@@ -44,14 +57,37 @@ class Application(models.Model):
     priority = models.IntegerField(default=0)
     notes = models.TextField(blank=True)
     tags = models.JSONField(default=list, blank=True)
+    # Denormalized so list views don't COUNT(*) attachments per row; kept in
+    # sync by the attachment upload/delete paths (see recount_attachments).
+    attachments_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Stored by Postgres on every write, bulk operations included
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector("title", weight="A", config="english")
+            + SearchVector("organization", weight="B", config="english")
+            + SearchVector(Cast("tags", models.TextField()), weight="B", config="english")
+            + SearchVector("location_country", weight="C", config="english")
+            + SearchVector("notes", weight="D", config="english")
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     class Meta:
         db_table = "applications"
         ordering = ["-created_at"]
         indexes = [
             models.Index(fields=["owner", "deadline"]),
+            models.Index(fields=["owner", "created_at", "id"]),
+            models.Index(fields=["owner", "updated_at"]),
+            GinIndex(
+                fields=["tags"],
+                opclasses=["jsonb_path_ops"],
+                name="applications_tags_gin",
+            ),
+            GinIndex(fields=["search_vector"], name="applications_search_gin"),
         ]
 
     def __str__(self):
@@ -62,6 +98,38 @@ def attachment_upload_path(instance, filename):
     return f"attachments/{instance.application.id}/{uuid.uuid4()}{os.path.splitext(filename)[1]}"
 
 
+def blob_upload_path(instance, filename):
+    # Content-addressed: the same bytes always land at the same path
+    digest = instance.sha256
+    extension = os.path.splitext(filename)[1].lower()
+    return f"attachments/blobs/{digest[:2]}/{digest}{extension}"
+
+
+class AttachmentBlob(models.Model):
+    """One stored file, shared by every attachment with the same contents."""
+
+    sha256 = models.CharField(max_length=64, primary_key=True)
+    file = models.FileField(upload_to=blob_upload_path, max_length=255)
+    size = models.PositiveBigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "attachment_blobs"
+        indexes = [
+            # Garbage collection only looks at unreferenced blobs
+            models.Index(
+                fields=["updated_at"],
+                condition=models.Q(ref_count=0),
+                name="attachment_blobs_unref_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return self.sha256
+
+
 class Attachment(models.Model):
     DOC_TYPE_CHOICES = [
         ("cv", "CV"),
@@ -81,6 +149,14 @@ class Attachment(models.Model):
             validate_file_size,
         ],
     )
+    # Null only for files stored before blobs; see repair_attachment_blobs
+    blob = models.ForeignKey(
+        AttachmentBlob,
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name="attachments",
+    )
     filename = models.CharField(max_length=255)
     file_size = models.IntegerField()
     content_type = models.CharField(max_length=100)
@@ -124,9 +200,118 @@ class Reminder(models.Model):
     remind_at = models.DateTimeField()
     channel = models.CharField(max_length=20, choices=CHANNEL_CHOICES, default="email")
     is_sent = models.BooleanField(default=False)
+    # Lease taken by the dispatcher; stale leases are reclaimed
+    claimed_at = models.DateTimeField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
     scheduled_task_id = models.CharField(max_length=255, blank=True)
 
     class Meta:
         db_table = "reminders"
-        ordering = ["remind_at"]
\ No newline at end of file
+        ordering = ["remind_at"]
+        indexes = [
+            # Only unsent reminders are ever scanned for due ones
+            models.Index(
+                fields=["remind_at"],
+                condition=models.Q(is_sent=False),
+                name="reminders_due_idx",
+            ),
+        ]
+
+
+class ArchivedReminder(models.Model):
+    """Sent reminder moved out of ``reminders`` after the retention window."""
+
+    id = models.UUIDField(primary_key=True, editable=False)
+    application = models.ForeignKey(
+        Application, on_delete=models.CASCADE, related_name="archived_reminders"
+    )
+    remind_at = models.DateTimeField()
+    channel = models.CharField(max_length=20, choices=Reminder.CHANNEL_CHOICES)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        db_table = "reminders_archive"
+        ordering = ["remind_at"]
+
+
+class DashboardRollup(models.Model):
+    owner = models.OneToOneField(
+        User, on_delete=models.CASCADE, primary_key=True, related_name="dashboard_rollup"
+    )
+    total = models.IntegerField(default=0)
+    status_counts = models.JSONField(default=dict, blank=True)
+    # ISO date -> applications created that day that are currently submitted
+    submissions_by_day = models.JSONField(default=dict, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "dashboard_rollups"
+
+    def __str__(self):
+        return f"Dashboard rollup for {self.owner_id}"
+
+
+class Tombstone(models.Model):
+    """Marks a deleted row so delta sync clients can drop it."""
+
+    KIND_CHOICES = [
+        ("application", "Application"),
+        ("attachment", "Attachment"),
+        ("reminder", "Reminder"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="tombstones")
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.UUIDField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = "tombstones"
+        ordering = ["deleted_at"]
+        indexes = [
+            models.Index(fields=["owner", "deleted_at"]),
+        ]
+
+    def __str__(self):
+        return f"Deleted {self.kind} {self.object_id}"
+
+
+def import_upload_path(instance, filename):
+    return f"imports/{instance.owner_id}/{uuid.uuid4()}.csv"
+
+
+class ImportJob(models.Model):
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("running", "Running"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name="import_jobs")
+    file = models.FileField(
+        upload_to=import_upload_path,
+        validators=[FileExtensionValidator(allowed_extensions=["csv"]), validate_file_size],
+    )
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending")
+    processed_rows = models.IntegerField(default=0)
+    created_count = models.IntegerField(default=0)
+    duplicate_count = models.IntegerField(default=0)
+    error_count = models.IntegerField(default=0)
+    # First IMPORT_MAX_ERRORS row errors, as {"row": n, "errors": {...}}
+    errors = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = "import_jobs"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Import {self.id} ({self.status})"
\ No newline at end of file
@@ -3,8 +3,9 @@ from rest_framework import permissions
 
 class IsOwner(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
-        if hasattr(obj, "owner"):
-            return obj.owner == request.user
+        # Compare ids so the check doesn't load the owner row.
+        if hasattr(obj, "owner_id"):
+            return obj.owner_id == request.user.pk
         if hasattr(obj, "application"):
-            return obj.application.owner == request.user
+            return obj.application.owner_id == request.user.pk
         return False
\ No newline at end of file
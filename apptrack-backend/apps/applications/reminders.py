@@ -0,0 +1,282 @@
+"""
+Claiming and delivery of due reminders.
+
+Due reminders are claimed in batches by stamping ``claimed_at`` on rows
+locked with ``SELECT ... FOR UPDATE SKIP LOCKED``, so several dispatchers
+can run at once without handing out the same reminder twice. A claim is a
+lease: if the worker sending the batch dies, the reminders become
+claimable again once ``REMINDER_LEASE_SECONDS`` have passed.
+
+Reminders live only in the database until they are close: each dispatcher
+run claims what falls due within the next ``REMINDER_BUCKET_SECONDS`` and
+enqueues it with a short ETA, so no worker holds tasks for reminders that
+are days or months away.
+
+Sent reminders older than ``REMINDER_ARCHIVE_AFTER_DAYS`` are moved to
+``reminders_archive`` so the hot table only grows with pending work.
+"""
+import logging
+import uuid
+from datetime import datetime, time, timedelta
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection, send_mail
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Application, ArchivedReminder, Reminder, Tombstone
+from .signals import invalidate_owner_cache
+from .tasks import dispatch_due_reminders
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SQL = """
+WITH moved AS (
+    DELETE FROM {reminders} AS r
+    USING {applications} AS a
+    WHERE r.id IN (
+        SELECT id FROM {reminders}
+        WHERE is_sent AND remind_at < %s
+        ORDER BY remind_at
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+    AND a.id = r.application_id
+    RETURNING r.*, a.owner_id
+),
+archived AS (
+    INSERT INTO {archive} (
+        id, application_id, remind_at, channel, created_at, updated_at, archived_at
+    )
+    SELECT id, application_id, remind_at, channel, created_at, updated_at, %s
+    FROM moved
+)
+SELECT id, owner_id FROM moved
+"""
+
+
+def lease_expired_before(now):
+    return now - timedelta(seconds=settings.REMINDER_LEASE_SECONDS)
+
+
+def claimable(now, until=None):
+    """Unsent reminders due by ``until`` and not held by a live lease."""
+    return (
+        Reminder.objects.filter(remind_at__lte=until or now, is_sent=False).filter(
+            Q(claimed_at__isnull=True) | Q(claimed_at__lt=lease_expired_before(now))
+        )
+        # Digest users get theirs in the daily digest instead
+        .exclude(application__owner__reminder_delivery="digest")
+    )
+
+
+def claim_due_reminders(batch_size, until=None, now=None):
+    """
+    Claim up to ``batch_size`` reminders due by ``until`` (default: now).
+
+    Returns ``(task_id, [(id, remind_at), ...])``. The claimed rows store
+    ``task_id`` as their ``scheduled_task_id`` for the task that sends them.
+    """
+    now = now or timezone.now()
+    task_id = str(uuid.uuid4())
+    with transaction.atomic():
+        rows = list(
+            claimable(now, until)
+            .select_for_update(skip_locked=True, of=("self",))
+            .order_by("remind_at")
+            .values_list("id", "remind_at")[:batch_size]
+        )
+        if rows:
+            Reminder.objects.filter(id__in=[pk for pk, _ in rows]).update(
+                claimed_at=now, scheduled_task_id=task_id
+            )
+    return task_id, rows
+
+
+def claim_reminder(reminder_id, now=None):
+    """Claim a single reminder; False if it is sent or leased elsewhere."""
+    now = now or timezone.now()
+    return bool(claimable(now).filter(id=reminder_id).update(claimed_at=now))
+
+
+def schedule_dispatch(reminders):
+    """
+    Dispatch right after commit if any of ``reminders`` falls in the
+    current bucket; later ones are picked up by the regular dispatch.
+    """
+    until = timezone.now() + timedelta(seconds=settings.REMINDER_BUCKET_SECONDS)
+    if any(reminder.remind_at <= until for reminder in reminders):
+        transaction.on_commit(dispatch_due_reminders.delay)
+
+
+def user_timezone(user):
+    try:
+        return ZoneInfo(user.timezone)
+    except (ZoneInfoNotFoundError, ValueError):
+        return timezone.get_default_timezone()
+
+
+def create_auto_reminders(
+    user, days_before, application_ids=None, statuses=None, channel="email"
+):
+    """
+    Create reminders ``days_before`` each deadline of the user's applications.
+
+    Reminders are set for ``REMINDER_AUTO_HOUR`` in the user's timezone.
+    Ones already in the past or identical to an existing reminder are
+    skipped. Returns ``(created, skipped)``.
+    """
+    tz = user_timezone(user)
+    now = timezone.now()
+    applications = Application.objects.filter(
+        owner=user, deadline__gte=timezone.localdate(now, tz)
+    )
+    if application_ids is not None:
+        applications = applications.filter(id__in=application_ids)
+    if statuses:
+        applications = applications.filter(status__in=statuses)
+
+    candidates = []
+    past = 0
+    for application_id, deadline in applications.values_list("id", "deadline"):
+        for days in sorted(set(days_before), reverse=True):
+            remind_at = datetime.combine(
+                deadline - timedelta(days=days),
+                time(settings.REMINDER_AUTO_HOUR),
+                tz,
+            )
+            if remind_at > now:
+                candidates.append(
+                    Reminder(
+                        application_id=application_id,
+                        remind_at=remind_at,
+                        channel=channel,
+                    )
+                )
+            else:
+                past += 1
+    if not candidates:
+        return [], past
+
+    existing = set(
+        Reminder.objects.filter(
+            application_id__in={r.application_id for r in candidates},
+            remind_at__in={r.remind_at for r in candidates},
+        ).values_list("application_id", "remind_at")
+    )
+    new = [r for r in candidates if (r.application_id, r.remind_at) not in existing]
+
+    with transaction.atomic():
+        created = Reminder.objects.bulk_create(new)
+        if created:
+            # Bulk writes bypass the model signals
+            invalidate_owner_cache(user.pk)
+            schedule_dispatch(created)
+    return created, past + len(candidates) - len(created)
+
+
+def build_message(reminder):
+    application = reminder.application
+    user = application.owner
+
+    subject = f"Reminder: {application.title} at {application.organization}"
+    message = f"""
+        Hi {user.first_name},
+
+        This is a reminder about your application:
+
+        Title: {application.title}
+        Organization: {application.organization}
+        Status: {application.get_status_display()}
+        Deadline: {application.deadline}
+
+        Notes: {application.notes}
+
+        Best regards,
+        AppTrack Team
+        """
+    return subject, message, [user.email]
+
+
+def build_email(reminder, connection=None):
+    subject, message, recipients = build_message(reminder)
+    return EmailMessage(
+        subject,
+        message,
+        settings.DEFAULT_FROM_EMAIL,
+        recipients,
+        connection=connection,
+    )
+
+
+def deliver_batch(reminders):
+    """
+    Send ``reminders`` over one mail connection and mark the sent ones.
+
+    Each message is handed to the connection on its own so a failure only
+    loses that reminder; it stays unsent and is retried once its lease
+    expires. Returns the reminders that were sent.
+    """
+    sent = []
+    now = timezone.now()
+    with get_connection() as connection:
+        for reminder in reminders:
+            try:
+                connection.send_messages([build_email(reminder, connection)])
+            except Exception as exc:
+                logger.error(f"Error sending reminder {reminder.id}: {exc}")
+                continue
+            reminder.is_sent = True
+            reminder.updated_at = now
+            sent.append(reminder)
+
+    if sent:
+        Reminder.objects.bulk_update(sent, ["is_sent", "updated_at"])
+        # Bulk writes bypass the model signals
+        for owner_id in {reminder.application.owner_id for reminder in sent}:
+            invalidate_owner_cache(owner_id)
+    return sent
+
+
+def deliver(reminder):
+    subject, message, recipients = build_message(reminder)
+    send_mail(
+        subject,
+        message,
+        settings.DEFAULT_FROM_EMAIL,
+        recipients,
+        fail_silently=False,
+    )
+    reminder.is_sent = True
+    reminder.save(update_fields=["is_sent", "updated_at"])
+
+
+def archive_cutoff():
+    return timezone.now() - timedelta(days=settings.REMINDER_ARCHIVE_AFTER_DAYS)
+
+
+def archive_sent_reminders(batch_size, cutoff=None):
+    """Move one batch of old sent reminders to the archive; returns the count."""
+    cutoff = cutoff or archive_cutoff()
+    sql = ARCHIVE_SQL.format(
+        reminders=Reminder._meta.db_table,
+        applications=Application._meta.db_table,
+        archive=ArchivedReminder._meta.db_table,
+    )
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [cutoff, batch_size, timezone.now()])
+            rows = cursor.fetchall()
+
+        # The rows leave the API, so sync clients need to drop them too
+        Tombstone.objects.bulk_create(
+            Tombstone(owner_id=owner_id, kind="reminder", object_id=reminder_id)
+            for reminder_id, owner_id in rows
+        )
+        # Raw SQL bypasses the model signals
+        for owner_id in {owner_id for _, owner_id in rows}:
+            invalidate_owner_cache(owner_id)
+
+    return len(rows)
@@ -0,0 +1,154 @@
+"""
+Incrementally maintained per-user dashboard counters.
+
+Every write path that creates, deletes or changes the status of an
+application calls ``apply_changes`` inside its own transaction, so the
+dashboard can read one ``DashboardRollup`` row instead of scanning the
+user's applications. ``reconcile_dashboard_rollups`` rebuilds rows that
+have drifted (admin edits, scripts, bugs).
+"""
+from collections import Counter
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Application, DashboardRollup
+
+SUBMISSION_WINDOW_DAYS = 30
+
+
+def snapshot(application):
+    """The parts of an application the rollup depends on."""
+    return (application.status, timezone.localdate(application.created_at))
+
+
+def window_start():
+    return timezone.localdate() - timedelta(days=SUBMISSION_WINDOW_DAYS)
+
+
+def compute_rollup(owner_ids):
+    """Build fresh rollup values for ``owner_ids`` from the applications table."""
+    values = {
+        owner_id: {"total": 0, "status_counts": {}, "submissions_by_day": {}}
+        for owner_id in owner_ids
+    }
+
+    status_rows = (
+        Application.objects.filter(owner_id__in=owner_ids)
+        .order_by()
+        .values("owner_id", "status")
+        .annotate(count=Count("id"))
+    )
+    for row in status_rows:
+        rollup = values[row["owner_id"]]
+        rollup["status_counts"][row["status"]] = row["count"]
+        rollup["total"] += row["count"]
+
+    submission_rows = (
+        Application.objects.filter(
+            owner_id__in=owner_ids,
+            status="submitted",
+            created_at__date__gte=window_start(),
+        )
+        .order_by()
+        .annotate(day=TruncDate("created_at"))
+        .values("owner_id", "day")
+        .annotate(count=Count("id"))
+    )
+    for row in submission_rows:
+        submissions = values[row["owner_id"]]["submissions_by_day"]
+        submissions[row["day"].isoformat()] = row["count"]
+
+    return values
+
+
+def rebuild(owner_id):
+    """Recompute one user's rollup from scratch, under a row lock."""
+    with transaction.atomic():
+        rollup, _ = DashboardRollup.objects.select_for_update().get_or_create(
+            owner_id=owner_id
+        )
+        fresh = compute_rollup([owner_id])[owner_id]
+        rollup.total = fresh["total"]
+        rollup.status_counts = fresh["status_counts"]
+        rollup.submissions_by_day = fresh["submissions_by_day"]
+        rollup.save()
+    return rollup
+
+
+def apply_changes(owner_id, changes):
+    """
+    Apply ``(before, after)`` snapshot pairs to the owner's rollup.
+
+    ``before`` is None for a created application and ``after`` is None for a
+    deleted one. Must run after the application rows have been written, in
+    the same transaction.
+    """
+    with transaction.atomic():
+        rollup = (
+            DashboardRollup.objects.select_for_update()
+            .filter(owner_id=owner_id)
+            .first()
+        )
+        if rollup is None:
+            # No baseline yet; the fresh count already includes this write.
+            rebuild(owner_id)
+            return
+
+        status_counts = Counter(rollup.status_counts)
+        submissions = Counter(rollup.submissions_by_day)
+        cutoff = window_start()
+
+        for before, after in changes:
+            for snap, delta in ((before, -1), (after, 1)):
+                if snap is None:
+                    continue
+                app_status, created = snap
+                status_counts[app_status] += delta
+                rollup.total += delta
+                if app_status == "submitted" and created >= cutoff:
+                    submissions[created.isoformat()] += delta
+
+        rollup.status_counts = {key: n for key, n in status_counts.items() if n > 0}
+        rollup.submissions_by_day = {
+            day: n
+            for day, n in submissions.items()
+            if n > 0 and day >= cutoff.isoformat()
+        }
+        rollup.save()
+
+
+def reconcile(owner_ids):
+    """Rebuild the rollups in ``owner_ids`` that no longer match the source rows."""
+    expected = compute_rollup(owner_ids)
+    current = DashboardRollup.objects.in_bulk(owner_ids)
+
+    rebuilt = 0
+    for owner_id, fresh in expected.items():
+        rollup = current.get(owner_id)
+        if rollup is None:
+            # Created lazily on the next write or dashboard read
+            continue
+        stored = {
+            "total": rollup.total,
+            "status_counts": rollup.status_counts,
+            "submissions_by_day": {
+                day: count
+                for day, count in rollup.submissions_by_day.items()
+                if day >= window_start().isoformat()
+            },
+        }
+        if stored != fresh:
+            rebuild(owner_id)
+            rebuilt += 1
+    return rebuilt
+
+
+def read_rollup(owner_id):
+    rollup = DashboardRollup.objects.filter(owner_id=owner_id).first()
+    if rollup is None:
+        rollup = rebuild(owner_id)
+    return rollup
@@ -1,5 +1,17 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Application, Attachment, StatusHistory, Reminder
+from .models import (
+    Application,
+    Attachment,
+    ImportJob,
+    Reminder,
+    StatusHistory,
+    Tombstone,
+)
+from .blobs import acquire_blob
 
 
 class AttachmentSerializer(serializers.ModelSerializer):
@@ -53,14 +65,43 @@ class ReminderSerializer(serializers.ModelSerializer):
             "channel",
             "is_sent",
             "created_at",
+            "updated_at",
+            "scheduled_task_id",
+        ]
+        read_only_fields = [
+            "id",
+            "is_sent",
+            "created_at",
+            "updated_at",
             "scheduled_task_id",
         ]
-        read_only_fields = ["id", "is_sent", "created_at", "scheduled_task_id"]
 
+    def validate_application(self, value):
+        request = self.context.get("request")
+        if request and value.owner_id != request.user.pk:
+            raise serializers.ValidationError("Application not found.")
+        return value
 
-class ApplicationListSerializer(serializers.ModelSerializer):
-    attachments_count = serializers.IntegerField(source="attachments.count", read_only=True)
 
+class AutoReminderSerializer(serializers.Serializer):
+    days_before = serializers.ListField(
+        child=serializers.IntegerField(min_value=0, max_value=365),
+        min_length=1,
+        max_length=10,
+    )
+    application_ids = serializers.ListField(
+        child=serializers.UUIDField(), required=False, allow_empty=False
+    )
+    statuses = serializers.ListField(
+        child=serializers.ChoiceField(choices=Application.STATUS_CHOICES),
+        required=False,
+    )
+    channel = serializers.ChoiceField(
+        choices=Reminder.CHANNEL_CHOICES, default="email"
+    )
+
+
+class ApplicationListSerializer(serializers.ModelSerializer):
     class Meta:
         model = Application
         fields = [
@@ -107,11 +148,114 @@ class ApplicationDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id", "owner", "created_at", "updated_at"]
 
+    def validate_tags(self, value):
+        if not isinstance(value, list) or not all(
+            isinstance(tag, str) for tag in value
+        ):
+            raise serializers.ValidationError("Tags must be a list of strings.")
+        return value
+
     def create(self, validated_data):
         validated_data["owner"] = self.context["request"].user
         return super().create(validated_data)
 
 
+class ApplicationSyncSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Application
+        fields = [
+            "id",
+            "kind",
+            "title",
+            "organization",
+            "location_country",
+            "source_url",
+            "applied_date",
+            "deadline",
+            "status",
+            "priority",
+            "notes",
+            "tags",
+            "attachments_count",
+            "created_at",
+            "updated_at",
+        ]
+
+
+class AttachmentSyncSerializer(AttachmentSerializer):
+    class Meta(AttachmentSerializer.Meta):
+        fields = AttachmentSerializer.Meta.fields + ["application"]
+
+
+class StatusHistorySyncSerializer(StatusHistorySerializer):
+    class Meta(StatusHistorySerializer.Meta):
+        fields = StatusHistorySerializer.Meta.fields + ["application"]
+
+
+class TombstoneSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Tombstone
+        fields = ["kind", "object_id", "deleted_at"]
+
+
+class BatchOperationSerializer(serializers.Serializer):
+    op = serializers.ChoiceField(choices=["create", "update", "delete"])
+    id = serializers.UUIDField(required=False)
+    data = serializers.DictField(required=False)
+
+    def validate(self, attrs):
+        if attrs["op"] != "create" and "id" not in attrs:
+            raise serializers.ValidationError(
+                {"id": "This field is required for update and delete."}
+            )
+        return attrs
+
+
+class ApplicationBatchSerializer(serializers.Serializer):
+    operations = BatchOperationSerializer(
+        many=True, allow_empty=False, max_length=settings.APPLICATION_BATCH_LIMIT
+    )
+
+
+class TransitionSerializer(serializers.Serializer):
+    to_status = serializers.ChoiceField(choices=Application.STATUS_CHOICES)
+    from_status = serializers.ChoiceField(
+        choices=Application.STATUS_CHOICES, required=False
+    )
+    note = serializers.CharField(required=False, allow_blank=True, default="")
+
+
+class BulkTransitionItemSerializer(TransitionSerializer):
+    id = serializers.UUIDField()
+    from_status = serializers.ChoiceField(choices=Application.STATUS_CHOICES)
+
+
+class BulkTransitionSerializer(serializers.Serializer):
+    transitions = BulkTransitionItemSerializer(
+        many=True, allow_empty=False, max_length=settings.APPLICATION_BATCH_LIMIT
+    )
+
+
+class ImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ImportJob
+        fields = [
+            "id",
+            "file",
+            "status",
+            "processed_rows",
+            "created_count",
+            "duplicate_count",
+            "error_count",
+            "errors",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = [field for field in fields if field != "file"]
+        extra_kwargs = {"file": {"write_only": True}}
+
+
 class AttachmentUploadSerializer(serializers.ModelSerializer):
     class Meta:
         model = Attachment
@@ -124,13 +268,20 @@ class AttachmentUploadSerializer(serializers.ModelSerializer):
         application = Application.objects.get(id=application_id, owner=request.user)
         file = validated_data["file"]
         
-        attachment = Attachment.objects.create(
-            application=application,
-            file=file,
-            filename=file.name,
-            file_size=file.size,
-            content_type=file.content_type,
-            doc_type=validated_data["doc_type"],
-            uploaded_by=request.user,
-        )
+        with transaction.atomic():
+            blob = acquire_blob(file)
+            attachment = Attachment.objects.create(
+                application=application,
+                blob=blob,
+                file=blob.file.name,
+                filename=file.name,
+                file_size=file.size,
+                content_type=file.content_type,
+                doc_type=validated_data["doc_type"],
+                uploaded_by=request.user,
+            )
+            Application.objects.filter(pk=application.pk).update(
+                attachments_count=F("attachments_count") + 1,
+                updated_at=timezone.now(),
+            )
         return attachment
\ No newline at end of file
@@ -0,0 +1,48 @@
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.cache import bump_user_version
+
+from .blobs import release_blob
+from .models import Application, Attachment, Reminder, StatusHistory
+
+
+def invalidate_owner_cache(owner_id):
+    # Bump immediately, and again after commit so a concurrent read that
+    # re-cached pre-commit data under the new version is orphaned too.
+    if owner_id is not None:
+        bump_user_version(owner_id)
+        transaction.on_commit(partial(bump_user_version, owner_id))
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def application_changed(sender, instance, **kwargs):
+    invalidate_owner_cache(instance.owner_id)
+
+
+@receiver(post_delete, sender=Attachment)
+def attachment_deleted(sender, instance, **kwargs):
+    # Covers direct deletes and cascades from applications and users
+    release_blob(instance.blob_id)
+
+
+@receiver(post_save, sender=Attachment)
+@receiver(post_delete, sender=Attachment)
+@receiver(post_save, sender=StatusHistory)
+@receiver(post_delete, sender=StatusHistory)
+@receiver(post_save, sender=Reminder)
+@receiver(post_delete, sender=Reminder)
+def application_child_changed(sender, instance, origin=None, **kwargs):
+    if isinstance(origin, Application):
+        # Cascading from an application delete, which bumps on its own
+        return
+    owner_id = (
+        Application.objects.filter(pk=instance.application_id)
+        .values_list("owner_id", flat=True)
+        .first()
+    )
+    invalidate_owner_cache(owner_id)
@@ -0,0 +1,140 @@
+"""
+Delta sync: everything that changed for a user since a cursor.
+
+A complete sync returns the server time it started at as the cursor, and
+the next sync re-reads a short overlap before it, so rows committed by
+transactions that were still open at that moment are not missed. Clients
+apply rows idempotently by id, so the overlap only costs a few duplicates.
+A truncated sync instead returns an exact cursor at the last row it sent:
+its timestamp plus, for each kind of row that stopped at that timestamp,
+the id of the last row sent, so rows sharing one timestamp resume by id.
+"""
+import base64
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Application, Attachment, Reminder, StatusHistory, Tombstone
+
+CURSOR_OVERLAP = timedelta(seconds=5)
+
+
+def encode_cursor(timestamp, after=None):
+    """
+    Encode a cursor; ``after`` maps source names to the last id sent.
+
+    ``after=None`` makes an overlap cursor, any dict an exact one.
+    """
+    if after is None:
+        raw = f"{timestamp.isoformat()}|overlap"
+    else:
+        positions = ",".join(f"{name}={pk}" for name, pk in sorted(after.items()))
+        raw = f"{timestamp.isoformat()}|exact|{positions}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """
+    Return ``(timestamp, after)``; ``after`` is None for an overlap cursor.
+
+    Raises ValueError on a malformed cursor.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        value, mode, *rest = raw.split("|")
+    except (ValueError, UnicodeError):
+        raise ValueError("Malformed cursor")
+    timestamp = parse_datetime(value)
+    if timestamp is None or (mode, len(rest)) not in (("overlap", 0), ("exact", 1)):
+        raise ValueError("Malformed cursor")
+    if mode == "overlap":
+        return timestamp, None
+    after = {}
+    for position in filter(None, rest[0].split(",")):
+        name, _, pk = position.partition("=")
+        try:
+            after[name] = uuid.UUID(pk)
+        except ValueError:
+            raise ValueError("Malformed cursor")
+    return timestamp, after
+
+
+def record_tombstone(owner_id, kind, object_id):
+    return Tombstone.objects.create(owner_id=owner_id, kind=kind, object_id=object_id)
+
+
+def tombstone_cutoff():
+    return timezone.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+
+
+def collect_changes(user, cursor=None, limit=None):
+    """
+    Return ``(changes, next_cursor, has_more)`` for rows changed since ``cursor``.
+
+    Each kind of row is capped at ``limit``. When any kind is truncated the
+    next cursor stops at the oldest truncated ``(timestamp, id)``, so the
+    following call resumes there and nothing is skipped, even when more
+    than ``limit`` rows share one timestamp.
+    """
+    limit = limit or settings.SYNC_CHANGES_LIMIT
+    since, after = None, None
+    if cursor:
+        since, after = decode_cursor(cursor)
+    started = timezone.now()
+    truncated = {}
+
+    sources = {
+        "applications": (
+            Application.objects.filter(owner=user),
+            "updated_at",
+        ),
+        "attachments": (
+            Attachment.objects.filter(application__owner=user),
+            "uploaded_at",
+        ),
+        "reminders": (
+            Reminder.objects.filter(application__owner=user),
+            "updated_at",
+        ),
+        "status_history": (
+            StatusHistory.objects.filter(application__owner=user).select_related(
+                "changed_by"
+            ),
+            "timestamp",
+        ),
+        "deleted": (
+            Tombstone.objects.filter(owner=user),
+            "deleted_at",
+        ),
+    }
+
+    changes = {}
+    for name, (queryset, field) in sources.items():
+        if after is None:
+            if since is not None:
+                queryset = queryset.filter(**{f"{field}__gt": since - CURSOR_OVERLAP})
+        elif name in after:
+            # (field, id) > (since, last id sent)
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": since})
+                | Q(**{field: since, "pk__gt": after[name]})
+            )
+        else:
+            queryset = queryset.filter(**{f"{field}__gte": since})
+        rows = list(queryset.order_by(field, "pk")[: limit + 1])
+        if len(rows) > limit:
+            rows = rows[:limit]
+            truncated[name] = (getattr(rows[-1], field), rows[-1].pk)
+        changes[name] = rows
+
+    if not truncated:
+        return changes, encode_cursor(started), False
+    position = min(timestamp for timestamp, _ in truncated.values())
+    last_ids = {
+        name: pk for name, (timestamp, pk) in truncated.items() if timestamp == position
+    }
+    return changes, encode_cursor(position, last_ids), True
@@ -0,0 +1,45 @@
+"""Tag filtering and facet counts over ``Application.tags``."""
+from collections import Counter
+from functools import reduce
+from operator import and_, or_
+
+from django.db import connection
+from django.db.models import CharField, Count, F, Func, Q
+
+
+def filter_by_tags(queryset, tags, match="all"):
+    """
+    Keep applications carrying all (or any) of ``tags``.
+
+    Each tag becomes its own ``@>`` containment test so both modes can use
+    the ``jsonb_path_ops`` GIN index, which only supports containment.
+    """
+    lookups = [Q(tags__contains=[tag]) for tag in tags]
+    return queryset.filter(reduce(or_ if match == "any" else and_, lookups))
+
+
+def tag_counts(queryset):
+    """Return ``[{"tag": ..., "count": ...}]`` for ``queryset``, most used first."""
+    queryset = queryset.order_by()
+    if connection.vendor == "postgresql":
+        return list(
+            queryset.annotate(
+                tag=Func(
+                    F("tags"),
+                    function="jsonb_array_elements_text",
+                    output_field=CharField(),
+                )
+            )
+            .values("tag")
+            .annotate(count=Count("id"))
+            .order_by("-count", "tag")
+        )
+
+    # Other backends (SQLite in local tests) count in Python
+    counts = Counter()
+    for tags in queryset.values_list("tags", flat=True).iterator():
+        counts.update(set(tags))
+    return [
+        {"tag": tag, "count": count}
+        for tag, count in sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    ]
@@ -1,74 +1,174 @@
 from celery import shared_task
-from django.core.mail import send_mail
 from django.conf import settings
-from django.utils import timezone
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# Only drains ETA tasks queued before reminders were bucketed by
+# dispatch_due_reminders; nothing enqueues it any more.
 @shared_task(bind=True, max_retries=3)
 def schedule_reminder(self, reminder_id):
     from .models import Reminder
+    from .reminders import claim_reminder, deliver
     
     try:
-        reminder = Reminder.objects.get(id=reminder_id)
+        # Skips reminders already sent or claimed by the dispatcher
+        if not claim_reminder(reminder_id):
+            return "Already sent or claimed"
         
-        if reminder.is_sent:
-            return "Already sent"
-        
-        application = reminder.application
-        user = application.owner
-        
-        subject = f"Reminder: {application.title} at {application.organization}"
-        message = f"""
-        Hi {user.first_name},
-        
-        This is a reminder about your application:
-        
-        Title: {application.title}
-        Organization: {application.organization}
-        Status: {application.get_status_display()}
-        Deadline: {application.deadline}
-        
-        Notes: {application.notes}
-        
-        Best regards,
-        AppTrack Team
-        """
-        
-        send_mail(
-            subject,
-            message,
-            settings.DEFAULT_FROM_EMAIL,
-            [user.email],
-            fail_silently=False,
+        reminder = Reminder.objects.select_related("application__owner").get(
+            id=reminder_id
         )
+        deliver(reminder)
         
-        reminder.is_sent = True
-        reminder.save()
-        
-        return f"Reminder sent to {user.email}"
+        return f"Reminder sent to {reminder.application.owner.email}"
         
     except Reminder.DoesNotExist:
         logger.error(f"Reminder {reminder_id} not found")
         return "Reminder not found"
     except Exception as exc:
         logger.error(f"Error sending reminder: {exc}")
+        Reminder.objects.filter(id=reminder_id).update(claimed_at=None)
         raise self.retry(exc=exc, countdown=60)
 
 
-@shared_task
-def check_and_send_reminders():
+@shared_task(bind=True)
+def send_reminder_batch(self, reminder_ids):
     from .models import Reminder
+    from .reminders import deliver_batch
     
-    now = timezone.now()
-    pending_reminders = Reminder.objects.filter(
-        remind_at__lte=now,
-        is_sent=False,
+    # Only rows still claimed for this task: if the lease ran out before
+    # the task started, another dispatch may have handed them out again.
+    reminders = list(
+        Reminder.objects.filter(
+            id__in=reminder_ids, is_sent=False, scheduled_task_id=self.request.id
+        ).select_related("application__owner")
     )
+    sent = deliver_batch(reminders)
+    
+    return f"Sent {len(sent)} of {len(reminder_ids)} reminders"
+
+
+@shared_task
+def dispatch_due_reminders():
+    from datetime import timedelta
+    from django.utils import timezone
+    from .reminders import claim_due_reminders
+    
+    now = timezone.now()
+    # Claim the next bucket too, so its reminders go out on time
+    until = now + timedelta(seconds=settings.REMINDER_BUCKET_SECONDS)
+    batch_size = settings.REMINDER_DISPATCH_BATCH_SIZE
+    dispatched = 0
+    for _ in range(settings.REMINDER_DISPATCH_MAX_BATCHES):
+        task_id, rows = claim_due_reminders(batch_size, until, now)
+        if not rows:
+            break
+        latest = max(remind_at for _, remind_at in rows)
+        send_reminder_batch.apply_async(
+            args=[[str(pk) for pk, _ in rows]],
+            task_id=task_id,
+            eta=latest if latest > now else None,
+        )
+        dispatched += len(rows)
+        if len(rows) < batch_size:
+            break
     
-    for reminder in pending_reminders:
-        schedule_reminder.delay(reminder.id)
+    return f"Dispatched {dispatched} reminders"
+
+
+@shared_task
+def send_reminder_digests():
+    from django.utils import timezone
+    from .digests import digest_users, send_digests
+    
+    now = timezone.now()
+    local_dates = digest_users(now)
+    user_ids = list(local_dates)
+    batch_size = settings.DIGEST_BATCH_SIZE
+    
+    sent = 0
+    for start in range(0, len(user_ids), batch_size):
+        batch = {pk: local_dates[pk] for pk in user_ids[start : start + batch_size]}
+        sent += send_digests(batch, now)
+    
+    return f"Sent {sent} digests"
+
+
+@shared_task
+def archive_sent_reminders():
+    from .reminders import archive_cutoff, archive_sent_reminders as archive_batch
+    
+    batch_size = settings.REMINDER_ARCHIVE_BATCH_SIZE
+    cutoff = archive_cutoff()
+    archived = 0
+    while True:
+        moved = archive_batch(batch_size, cutoff)
+        archived += moved
+        if moved < batch_size:
+            break
+    
+    return f"Archived {archived} reminders"
+
+
+@shared_task
+def reconcile_dashboard_rollups(batch_size=500):
+    from django.contrib.auth import get_user_model
+    from .rollups import reconcile
+    
+    User = get_user_model()
+    user_ids = User.objects.order_by("pk").values_list("pk", flat=True)
+    
+    rebuilt = 0
+    batch = []
+    for user_id in user_ids.iterator(chunk_size=batch_size):
+        batch.append(user_id)
+        if len(batch) == batch_size:
+            rebuilt += reconcile(batch)
+            batch = []
+    if batch:
+        rebuilt += reconcile(batch)
+    
+    return f"Rebuilt {rebuilt} dashboard rollups"
+
+
+@shared_task
+def prune_tombstones():
+    from .models import Tombstone
+    from .sync import tombstone_cutoff
+    
+    deleted, _ = Tombstone.objects.filter(deleted_at__lt=tombstone_cutoff()).delete()
+    return f"Pruned {deleted} tombstones"
+
+
+@shared_task
+def import_applications(job_id):
+    from .imports import fail_import, run_import
+    from .models import ImportJob
+    
+    try:
+        job = ImportJob.objects.get(id=job_id)
+    except ImportJob.DoesNotExist:
+        logger.error(f"Import job {job_id} not found")
+        return "Import job not found"
+    
+    try:
+        job = run_import(job)
+    except Exception as exc:
+        logger.error(f"Error importing applications: {exc}")
+        fail_import(job_id, exc)
+        return "Import failed"
+    
+    return f"Imported {job.created_count} of {job.processed_rows} rows"
+
+
+@shared_task
+def collect_attachment_garbage(dry_run=False):
+    from .garbage import collect_garbage
     
-    return f"Processed {pending_reminders.count()} reminders"
\ No newline at end of file
+    metrics = collect_garbage(dry_run=dry_run)
+    return (
+        f"Deleted {metrics['blobs_deleted']} blobs and {metrics['files_deleted']} "
+        f"orphaned files, freed {metrics['bytes_freed']} bytes"
+    )
\ No newline at end of file
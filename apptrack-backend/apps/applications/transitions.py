@@ -0,0 +1,94 @@
+"""
+Status transitions as conditional single-statement updates.
+
+A transition only applies while the application is still in the status
+the caller expects, so two concurrent edits can't both record history
+from the same old status. The status change and its ``StatusHistory`` row
+are written by one Postgres statement, in a single round trip.
+"""
+import uuid
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import Application, StatusHistory
+from .rollups import apply_changes
+from .signals import invalidate_owner_cache
+
+TRANSITION_SQL = """
+WITH requested (id, from_status, to_status, note, history_id) AS (
+    VALUES {values}
+),
+updated AS (
+    UPDATE {applications} AS a
+    SET status = r.to_status, updated_at = %s
+    FROM requested AS r
+    WHERE a.id = r.id::uuid AND a.owner_id = %s AND a.status = r.from_status
+    RETURNING a.id, a.created_at, r.from_status, r.to_status, r.note, r.history_id
+),
+history AS (
+    INSERT INTO {history} (
+        id, application_id, from_status, to_status, changed_by_id, note, timestamp
+    )
+    SELECT u.history_id::uuid, u.id, u.from_status, u.to_status, %s, u.note, %s
+    FROM updated AS u
+    RETURNING application_id
+)
+SELECT u.id, u.created_at, u.from_status, u.to_status
+FROM updated AS u JOIN history AS h ON h.application_id = u.id
+"""
+
+
+def can_transition(from_status, to_status):
+    return to_status in Application.STATUS_TRANSITIONS.get(from_status, ())
+
+
+def apply_transitions(user, transitions):
+    """
+    Apply ``{"id", "from_status", "to_status", "note"}`` transitions.
+
+    Callers validate each pair with ``can_transition`` first. Returns the
+    ids (as strings) of the applications that moved; the rest were either
+    missing or no longer in ``from_status``.
+    """
+    if not transitions:
+        return set()
+
+    values = ", ".join(["(%s, %s, %s, %s, %s)"] * len(transitions))
+    params = []
+    for item in transitions:
+        params += [
+            str(item["id"]),
+            item["from_status"],
+            item["to_status"],
+            item.get("note", ""),
+            str(uuid.uuid4()),
+        ]
+    now = timezone.now()
+    params += [now, user.pk, user.pk, now]
+
+    sql = TRANSITION_SQL.format(
+        values=values,
+        applications=Application._meta.db_table,
+        history=StatusHistory._meta.db_table,
+    )
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+
+        if rows:
+            apply_changes(
+                user.pk,
+                [
+                    (
+                        (from_status, timezone.localdate(created_at)),
+                        (to_status, timezone.localdate(created_at)),
+                    )
+                    for _, created_at, from_status, to_status in rows
+                ],
+            )
+            # Raw SQL bypasses the model signals
+            invalidate_owner_cache(user.pk)
+
+    return {str(row[0]) for row in rows}
@@ -7,7 +7,9 @@ from .views import (
     StatusHistoryListView,
     ReminderListCreateView,
     ReminderDetailView,
+    AutoReminderView,
     DashboardSummaryView,
+    ImportJobDetailView,
 )
 
 router = DefaultRouter()
@@ -15,6 +17,11 @@ router.register("applications", ApplicationViewSet, basename="application")
 
 urlpatterns = [
     path("", include(router.urls)),
+    path(
+        "applications/imports/<uuid:pk>/",
+        ImportJobDetailView.as_view(),
+        name="import-job-detail",
+    ),
     path(
         "applications/<uuid:application_id>/attachments/",
         AttachmentUploadView.as_view(),
@@ -36,6 +43,7 @@ urlpatterns = [
         name="reminder-list-create",
     ),
     path("reminders/", ReminderListCreateView.as_view(), name="all-reminders"),
+    path("reminders/auto/", AutoReminderView.as_view(), name="auto-reminders"),
     path("reminders/<uuid:pk>/", ReminderDetailView.as_view(), name="reminder-detail"),
     path("dashboard/summary/", DashboardSummaryView.as_view(), name="dashboard-summary"),
 ]
\ No newline at end of file
@@ -1,31 +1,97 @@
 from rest_framework import generics, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.viewsets import ModelViewSet
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from django.db.models import Count, Q
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from django.db import transaction
+from django.db.models import (
+    F,
+    Prefetch,
+    Window,
+    prefetch_related_objects,
+)
+from django.db.models.functions import RowNumber
 from django.utils import timezone
 from datetime import timedelta
+import uuid
+
+from apps.core.cache import cache_response
+from apps.core.pagination import CreatedAtCursorPagination
 
-from .models import Application, Attachment, StatusHistory, Reminder
+from .models import Application, Attachment, ImportJob, StatusHistory, Reminder
 from .serializers import (
     ApplicationListSerializer,
+    ApplicationBatchSerializer,
     ApplicationDetailSerializer,
+    ApplicationSyncSerializer,
+    AutoReminderSerializer,
+    BulkTransitionSerializer,
+    ImportJobSerializer,
     AttachmentSerializer,
+    AttachmentSyncSerializer,
     AttachmentUploadSerializer,
     StatusHistorySerializer,
+    StatusHistorySyncSerializer,
     ReminderSerializer,
+    TombstoneSerializer,
+    TransitionSerializer,
+)
+from .batch import apply_batch
+from .export import (
+    CSVRenderer,
+    NDJSONRenderer,
+    export_rows,
+    stream_csv,
+    stream_ndjson,
+)
+from .conditional import (
+    applications_etag,
+    applications_last_modified,
+    dashboard_etag,
+    dashboard_last_modified,
 )
 from .permissions import IsOwner
-from .tasks import schedule_reminder
+from .reminders import create_auto_reminders, schedule_dispatch
+from .rollups import apply_changes, read_rollup, snapshot, window_start
+from .sync import collect_changes, decode_cursor, record_tombstone, tombstone_cutoff
+from .tags import filter_by_tags, tag_counts
+from .transitions import apply_transitions, can_transition
+from .tasks import import_applications
 
 
 class ApplicationViewSet(ModelViewSet):
     permission_classes = [IsAuthenticated, IsOwner]
+    cursor_pagination_class = CreatedAtCursorPagination
+    # update/partial_update prefetch after saving instead (see update())
+    detail_actions = ("retrieve",)
+    history_limit = 20
+    max_history_limit = 100
+    
+    @property
+    def paginator(self):
+        # Keyset pagination is opt-in (?pagination=cursor, or any ?cursor=)
+        # so the default page-number contract stays unchanged.
+        if not hasattr(self, "_paginator"):
+            params = self.request.query_params
+            if params.get("pagination") == "cursor" or "cursor" in params:
+                self._paginator = self.cursor_pagination_class()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
     
     def get_queryset(self):
-        queryset = Application.objects.filter(owner=self.request.user)
+        # Same (created_at, id) order in both pagination modes, so rows
+        # sharing a created_at never swap places between pages
+        ordering = self.cursor_pagination_class.ordering
+        queryset = Application.objects.filter(owner=self.request.user).order_by(
+            *ordering
+        )
         
         # Filters
         status = self.request.query_params.get("status")
@@ -37,22 +103,101 @@ class ApplicationViewSet(ModelViewSet):
         if kind:
             queryset = queryset.filter(kind=kind)
         if tags:
-            tag_list = tags.split(",")
-            queryset = queryset.filter(tags__contains=tag_list)
+            tag_list = [tag for tag in tags.split(",") if tag]
+            match = self.request.query_params.get("tags_match", "all")
+            queryset = filter_by_tags(queryset, tag_list, match)
+        
+        q = self.request.query_params.get("q", "").strip()
+        if q:
+            query = SearchQuery(q, search_type="websearch", config="english")
+            queryset = (
+                queryset.filter(search_vector=query)
+                .annotate(rank=SearchRank(F("search_vector"), query))
+                .order_by("-rank", *ordering)
+            )
+        
+        if self.action in self.detail_actions:
+            queryset = queryset.prefetch_related(*self.get_detail_prefetches())
             
         return queryset
     
+    def get_history_limit(self):
+        try:
+            limit = int(self.request.query_params["history_limit"])
+        except (KeyError, ValueError):
+            return self.history_limit
+        return max(0, min(limit, self.max_history_limit))
+    
+    def get_detail_prefetches(self):
+        # One query per nested relation, regardless of how long the history is;
+        # the full history stays available from StatusHistoryListView. The cap
+        # is a window filter rather than a slice because Django can't apply a
+        # sliced Prefetch to a single instance.
+        history = (
+            StatusHistory.objects.select_related("changed_by")
+            .annotate(
+                row_number=Window(
+                    RowNumber(),
+                    partition_by=F("application_id"),
+                    order_by=F("timestamp").desc(),
+                )
+            )
+            .filter(row_number__lte=self.get_history_limit())
+        )
+        return [
+            "attachments",
+            Prefetch("status_history", queryset=history),
+            "reminders",
+        ]
+    
+    @method_decorator(
+        condition(
+            etag_func=applications_etag, last_modified_func=applications_last_modified
+        )
+    )
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        if request.query_params.get("q", "").strip() and isinstance(
+            self.paginator, self.cursor_pagination_class
+        ):
+            # The cursor paginator re-orders by (created_at, id), which would
+            # silently discard the search ranking
+            raise ValidationError(
+                {"q": "Search results are ranked; use page-number pagination."}
+            )
+        return super().list(request, *args, **kwargs)
+    
+    @cache_response
+    def retrieve(self, request, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+    
     def get_serializer_class(self):
         if self.action == "list":
             return ApplicationListSerializer
         return ApplicationDetailSerializer
     
+    @transaction.atomic
     def perform_create(self, serializer):
-        serializer.save(owner=self.request.user)
+        instance = serializer.save(owner=self.request.user)
+        apply_changes(instance.owner_id, [(None, snapshot(instance))])
     
-    def perform_update(self, serializer):
+    def update(self, request, *args, **kwargs):
+        partial = kwargs.pop("partial", False)
         instance = self.get_object()
+        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer.is_valid(raise_exception=True)
+        self.perform_update(serializer)
+        
+        # Prefetch after the write, which may have added history rows, instead
+        # of letting the serializer lazy-load the nested relations.
+        prefetch_related_objects([instance], *self.get_detail_prefetches())
+        return Response(self.get_serializer(instance).data)
+    
+    @transaction.atomic
+    def perform_update(self, serializer):
+        instance = serializer.instance
         old_status = instance.status
+        before = snapshot(instance)
         updated_instance = serializer.save()
         
         # Create status history if status changed
@@ -63,6 +208,186 @@ class ApplicationViewSet(ModelViewSet):
                 to_status=updated_instance.status,
                 changed_by=self.request.user,
             )
+            apply_changes(
+                updated_instance.owner_id, [(before, snapshot(updated_instance))]
+            )
+    
+    @transaction.atomic
+    def perform_destroy(self, instance):
+        before = snapshot(instance)
+        record_tombstone(instance.owner_id, "application", instance.pk)
+        super().perform_destroy(instance)
+        apply_changes(instance.owner_id, [(before, None)])
+    
+    @action(detail=False, methods=["post"])
+    def batch(self, request):
+        """Apply many create/update/delete operations in one transaction."""
+        serializer = ApplicationBatchSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = apply_batch(request, serializer.validated_data["operations"])
+        return Response({"results": results})
+    
+    @action(detail=True, methods=["post"])
+    def transition(self, request, pk=None):
+        """Move one application to a new status if it is still in the old one."""
+        serializer = TransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        applications = Application.objects.filter(owner=request.user)
+        
+        try:
+            application_id = uuid.UUID(pk)
+        except ValueError:
+            raise NotFound()
+        from_status = data.get("from_status")
+        if from_status is None:
+            from_status = applications.filter(pk=application_id).values_list(
+                "status", flat=True
+            ).first()
+            if from_status is None:
+                raise NotFound()
+        if not can_transition(from_status, data["to_status"]):
+            raise ValidationError(
+                {"to_status": f"Cannot move from {from_status} to {data['to_status']}."}
+            )
+        
+        transitioned = apply_transitions(
+            request.user,
+            [{"id": application_id, "from_status": from_status, **data}],
+        )
+        if not transitioned:
+            current = applications.filter(pk=application_id).values_list(
+                "status", flat=True
+            ).first()
+            if current is None:
+                raise NotFound()
+            return Response(
+                {
+                    "detail": "Application is no longer in the expected status.",
+                    "status": current,
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response({
+            "id": str(application_id),
+            "from_status": from_status,
+            "to_status": data["to_status"],
+        })
+    
+    @action(detail=False, methods=["post"], url_path="transition")
+    def bulk_transition(self, request):
+        """Apply many transitions in one statement; reports each item."""
+        serializer = BulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data["transitions"]
+        
+        results = []
+        valid = []
+        seen = set()
+        for index, item in enumerate(items):
+            result = {"index": index, "id": str(item["id"])}
+            if item["id"] in seen:
+                result.update(status="error", detail="Duplicate id in batch.")
+            elif not can_transition(item["from_status"], item["to_status"]):
+                result.update(status="error", detail="Transition not allowed.")
+            else:
+                valid.append(item)
+            seen.add(item["id"])
+            results.append(result)
+        
+        transitioned = apply_transitions(request.user, valid)
+        for result, item in zip(results, items):
+            if "status" not in result:
+                if str(item["id"]) in transitioned:
+                    result["status"] = "transitioned"
+                else:
+                    result.update(
+                        status="conflict", detail="Missing or status changed."
+                    )
+        return Response({"results": results})
+    
+    @action(
+        detail=False,
+        methods=["get"],
+        renderer_classes=[CSVRenderer, NDJSONRenderer],
+    )
+    def export(self, request):
+        """Stream the filtered applications as CSV or NDJSON (``?format=``)."""
+        include_history_count = request.query_params.get(
+            "include_history_count", ""
+        ).lower() in ("1", "true")
+        fields, rows = export_rows(self.get_queryset(), include_history_count)
+        
+        if request.accepted_renderer.format == "ndjson":
+            response = StreamingHttpResponse(
+                stream_ndjson(rows), content_type="application/x-ndjson"
+            )
+            filename = "applications.ndjson"
+        else:
+            response = StreamingHttpResponse(
+                stream_csv(fields, rows), content_type="text/csv"
+            )
+            filename = "applications.csv"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+    
+    @action(detail=False, methods=["post"], url_path="import")
+    def import_csv(self, request):
+        """Store an uploaded CSV and import it in the background."""
+        serializer = ImportJobSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        job = serializer.save(owner=request.user)
+        transaction.on_commit(lambda: import_applications.delay(str(job.id)))
+        return Response(ImportJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
+    
+    @action(detail=False, methods=["get"], url_path="tags")
+    def tag_facets(self, request):
+        """Per-tag counts over the (filtered) applications."""
+        return Response(tag_counts(self.get_queryset()))
+    
+    @action(detail=False, methods=["get"])
+    def changes(self, request):
+        """Rows created, updated or deleted since the ``since`` cursor."""
+        since = request.query_params.get("since")
+        if since:
+            try:
+                timestamp, _ = decode_cursor(since)
+            except ValueError:
+                raise ValidationError({"since": "Invalid cursor."})
+            if timestamp < tombstone_cutoff():
+                # Deletions older than the retention window are gone
+                return Response(
+                    {"detail": "Cursor expired; resync from the full list."},
+                    status=status.HTTP_410_GONE,
+                )
+        
+        changes, cursor, has_more = collect_changes(request.user, since)
+        context = self.get_serializer_context()
+        return Response({
+            "cursor": cursor,
+            "has_more": has_more,
+            "applications": ApplicationSyncSerializer(
+                changes["applications"], many=True, context=context
+            ).data,
+            "attachments": AttachmentSyncSerializer(
+                changes["attachments"], many=True, context=context
+            ).data,
+            "reminders": ReminderSerializer(
+                changes["reminders"], many=True, context=context
+            ).data,
+            "status_history": StatusHistorySyncSerializer(
+                changes["status_history"], many=True, context=context
+            ).data,
+            "deleted": TombstoneSerializer(changes["deleted"], many=True).data,
+        })
+
+
+class ImportJobDetailView(generics.RetrieveAPIView):
+    serializer_class = ImportJobSerializer
+    permission_classes = [IsAuthenticated]
+    
+    def get_queryset(self):
+        return ImportJob.objects.filter(owner=self.request.user)
 
 
 class AttachmentUploadView(generics.CreateAPIView):
@@ -88,6 +413,17 @@ class AttachmentDetailView(generics.DestroyAPIView):
             application_id=application_id,
             application__owner=self.request.user,
         )
+    
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            record_tombstone(self.request.user.pk, "attachment", instance.pk)
+            super().perform_destroy(instance)
+            Application.objects.filter(
+                pk=instance.application_id, attachments_count__gt=0
+            ).update(
+                attachments_count=F("attachments_count") - 1,
+                updated_at=timezone.now(),
+            )
 
 
 class StatusHistoryListView(generics.ListAPIView):
@@ -114,66 +450,110 @@ class ReminderListCreateView(generics.ListCreateAPIView):
             )
         return Reminder.objects.filter(application__owner=self.request.user)
     
+    @cache_response
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+    
     def perform_create(self, serializer):
+        # One write; the dispatcher only sees the row once it is committed
         reminder = serializer.save()
-        # Schedule the reminder task
-        task = schedule_reminder.apply_async(
-            args=[reminder.id], eta=reminder.remind_at
+        schedule_dispatch([reminder])
+
+
+class AutoReminderView(generics.GenericAPIView):
+    """Create reminders N days before the deadlines of many applications."""
+    
+    serializer_class = AutoReminderSerializer
+    permission_classes = [IsAuthenticated]
+    
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        created, skipped = create_auto_reminders(
+            request.user, **serializer.validated_data
+        )
+        return Response(
+            {
+                "created": len(created),
+                "skipped": skipped,
+                "reminders": ReminderSerializer(created, many=True).data,
+            },
+            status=status.HTTP_201_CREATED,
         )
-        reminder.scheduled_task_id = task.id
-        reminder.save()
 
 
 class ReminderDetailView(generics.DestroyAPIView):
     queryset = Reminder.objects.all()
     permission_classes = [IsAuthenticated, IsOwner]
     
+    @transaction.atomic
     def perform_destroy(self, instance):
-        # Cancel the scheduled task
-        if instance.scheduled_task_id:
-            from celery.result import AsyncResult
-            AsyncResult(instance.scheduled_task_id).revoke()
+        # A claimed batch skips reminders deleted before it runs
+        record_tombstone(instance.application.owner_id, "reminder", instance.pk)
         super().perform_destroy(instance)
 
 
 class DashboardSummaryView(generics.GenericAPIView):
     permission_classes = [IsAuthenticated]
+    sections = (
+        "upcoming_deadlines",
+        "status_counts",
+        "monthly_submissions",
+        "conversion_rate",
+    )
     
+    def get_sections(self):
+        requested = self.request.query_params.get("sections")
+        if not requested:
+            return set(self.sections)
+        sections = {
+            section.strip() for section in requested.split(",") if section.strip()
+        }
+        unknown = sections.difference(self.sections)
+        if unknown:
+            raise ValidationError(
+                {"sections": f"Unknown sections: {', '.join(sorted(unknown))}"}
+            )
+        return sections
+    
+    @method_decorator(
+        condition(etag_func=dashboard_etag, last_modified_func=dashboard_last_modified)
+    )
+    # Upcoming deadlines shift with the date even when no row changes
+    @cache_response(vary=lambda request: timezone.localdate())
     def get(self, request):
         user = request.user
+        sections = self.get_sections()
         now = timezone.now()
-        seven_days = now + timedelta(days=7)
-        
-        # Upcoming deadlines
-        upcoming_deadlines = Application.objects.filter(
-            owner=user,
-            deadline__gte=now.date(),
-            deadline__lte=seven_days.date(),
-        ).values("id", "title", "organization", "deadline")
-        
-        # Status counts
-        status_counts = (
-            Application.objects.filter(owner=user)
-            .values("status")
-            .annotate(count=Count("status"))
-        )
+        data = {}
         
-        # Monthly submissions
-        thirty_days_ago = now - timedelta(days=30)
-        submissions = Application.objects.filter(
-            owner=user,
-            created_at__gte=thirty_days_ago,
-            status="submitted",
-        ).count()
+        if "upcoming_deadlines" in sections:
+            seven_days = now + timedelta(days=7)
+            data["upcoming_deadlines"] = list(
+                Application.objects.filter(
+                    owner=user,
+                    deadline__gte=now.date(),
+                    deadline__lte=seven_days.date(),
+                ).values("id", "title", "organization", "deadline")
+            )
         
-        # Conversion rate
-        total = Application.objects.filter(owner=user).count()
-        offers = Application.objects.filter(owner=user, status="offer").count()
-        conversion_rate = (offers / total * 100) if total > 0 else 0
+        if sections.difference({"upcoming_deadlines"}):
+            # Counts come from the incrementally maintained rollup row
+            rollup = read_rollup(user.pk)
+            
+            if "status_counts" in sections:
+                data["status_counts"] = rollup.status_counts
+            if "monthly_submissions" in sections:
+                cutoff = window_start().isoformat()
+                data["monthly_submissions"] = sum(
+                    count
+                    for day, count in rollup.submissions_by_day.items()
+                    if day >= cutoff
+                )
+            if "conversion_rate" in sections:
+                total = rollup.total
+                offers = rollup.status_counts.get("offer", 0)
+                conversion_rate = (offers / total * 100) if total > 0 else 0
+                data["conversion_rate"] = round(conversion_rate, 2)
         
-        return Response({
-            "upcoming_deadlines": upcoming_deadlines,
-            "status_counts": {item["status"]: item["count"] for item in status_counts},
-            "monthly_submissions": submissions,
-            "conversion_rate": round(conversion_rate, 2),
-        })
\ No newline at end of file
+        return Response(data)
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Per-user response cache with version-counter invalidation.
+
+Cached responses are keyed by user, the user's current version, the request
+path, the normalized query string and, optionally, a view-specific value
+such as the current date. Any write to a user's data bumps the
+version, which orphans every cached response for that user at once without
+scanning keys; the orphans simply expire.
+"""
+import hashlib
+import time
+from functools import partial, wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+HITS_KEY = "response-cache:hits"
+MISSES_KEY = "response-cache:misses"
+
+
+def _version_key(user_id):
+    return f"response-cache:version:{user_id}"
+
+
+def _incr(key, initial=0):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        cache.add(key, initial, timeout=None)
+        return cache.incr(key)
+
+
+def bump_user_version(user_id):
+    # Versions are seeded from the clock so one that was evicted comes back
+    # larger than any value it had before and never revives old entries.
+    return _incr(_version_key(user_id), initial=time.time_ns() // 1000)
+
+
+def get_user_version(user_id):
+    version = cache.get(_version_key(user_id))
+    if version is None:
+        version = bump_user_version(user_id)
+    return version
+
+
+def response_cache_key(request, vary=None):
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    extra = f"#{vary(request)}" if vary else ""
+    digest = hashlib.md5(f"{request.path}?{query}{extra}".encode()).hexdigest()
+    version = get_user_version(request.user.pk)
+    return f"response-cache:{request.user.pk}:{version}:{digest}"
+
+
+def cache_response(view_method=None, *, vary=None):
+    """
+    Cache a view method's successful response data per user.
+
+    ``vary(request)``, if given, is added to the key for responses that
+    change without any write, e.g. with the date.
+    """
+    if view_method is None:
+        return partial(cache_response, vary=vary)
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = response_cache_key(request, vary)
+        data = cache.get(key)
+        if data is not None:
+            _incr(HITS_KEY)
+            return Response(data, headers={"X-Cache": "HIT"})
+
+        _incr(MISSES_KEY)
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(key, response.data, settings.RESPONSE_CACHE_TIMEOUT)
+            response["X-Cache"] = "MISS"
+        return response
+
+    return wrapper
+
+
+def response_cache_stats():
+    hits = cache.get(HITS_KEY) or 0
+    misses = cache.get(MISSES_KEY) or 0
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups * 100, 2) if lookups else 0,
+    }
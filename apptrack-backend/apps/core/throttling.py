@@ -0,0 +1,69 @@
+"""
+Sliding-window-counter throttles backed by the shared cache.
+
+DRF's stock throttles keep a list of request timestamps per client, which
+grows with the rate and is rewritten on every request. These keep two
+integer counters per client instead (the current and previous fixed
+window) and estimate the sliding window as
+
+    previous * (1 - elapsed_fraction) + current
+
+Counters are bumped with the cache's atomic ``incr``, so every process
+sharing the Redis cache sees the same counts.
+"""
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+
+
+class SlidingWindowThrottleMixin:
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        window, offset = divmod(now, self.duration)
+        current_key = f"{self.key}:{int(window)}"
+        previous_key = f"{self.key}:{int(window) - 1}"
+        self.elapsed = offset / self.duration
+
+        counts = self.cache.get_many([previous_key, current_key])
+        self.previous = counts.get(previous_key, 0)
+        current = counts.get(current_key, 0)
+        if self.estimate(current) >= self.num_requests:
+            self.current = current
+            return self.throttle_failure()
+
+        # Kept for two windows so it can serve as the next "previous"
+        self.cache.add(current_key, 0, self.duration * 2)
+        try:
+            self.current = self.cache.incr(current_key)
+        except ValueError:
+            # Expired between add() and incr()
+            self.cache.set(current_key, 1, self.duration * 2)
+            self.current = 1
+        # Re-check with the atomic count in case of concurrent requests
+        if self.estimate(self.current) > self.num_requests:
+            return self.throttle_failure()
+        return True
+
+    def estimate(self, current):
+        return self.previous * (1 - self.elapsed) + current
+
+    def wait(self):
+        remaining = (1 - self.elapsed) * self.duration
+        if self.current >= self.num_requests or not self.previous:
+            return remaining
+        # Until enough of the previous window has slid out for one more
+        needed = 1 - (self.num_requests - self.current - 1) / self.previous
+        return max((needed - self.elapsed) * self.duration, 0)
+
+
+class SlidingWindowAnonRateThrottle(SlidingWindowThrottleMixin, AnonRateThrottle):
+    pass
+
+
+class SlidingWindowUserRateThrottle(SlidingWindowThrottleMixin, UserRateThrottle):
+    pass
@@ -6,6 +6,6 @@ from .models import User
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     list_display = ("email", "username", "first_name", "last_name", "is_active")
-    list_filter = ("is_active", "is_staff", "created_at")
+    list_filter = ("is_active", "is_staff", "reminder_delivery", "created_at")
     search_fields = ("email", "username", "first_name", "last_name")
     ordering = ("-created_at",)
\ No newline at end of file
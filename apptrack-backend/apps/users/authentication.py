@@ -0,0 +1,122 @@
+"""
+JWT authentication that resolves the user from a cache.
+
+Users are cached in the shared cache for ``USER_CACHE_TIMEOUT`` seconds and
+in a small per-process LRU for ``USER_CACHE_LOCAL_TTL`` seconds in front of
+it, so most authenticated requests skip the ``users`` lookup entirely.
+Saving or deleting a user clears both (see ``signals.py``); other processes
+drop their local copy within the local TTL. The password hash is left out
+(deferred) unless ``CHECK_REVOKE_TOKEN`` needs it on every request.
+"""
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+User = get_user_model()
+
+
+class LocalLRUCache:
+    """Thread-safe, size-bounded LRU whose entries expire after ``ttl``."""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+local_users = LocalLRUCache(
+    maxsize=settings.USER_CACHE_LOCAL_SIZE, ttl=settings.USER_CACHE_LOCAL_TTL
+)
+
+
+def user_cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def get_cached_user(user_id):
+    """Return a copy of the user with ``user_id``, or None if there is none."""
+    key = user_cache_key(user_id)
+    user = local_users.get(key)
+    if user is None:
+        user = cache.get(key)
+        if user is None:
+            users = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+            if not api_settings.CHECK_REVOKE_TOKEN:
+                # Keep password hashes out of the shared cache
+                users = users.defer("password")
+            user = users.first()
+            if user is None:
+                return None
+            cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+        local_users.set(key, user)
+    # Views may modify request.user; keep the cached instance pristine
+    return copy.copy(user)
+
+
+def invalidate_user(user_id):
+    key = user_cache_key(user_id)
+    local_users.delete(key)
+    cache.delete(key)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(
+                api_settings.REVOKE_TOKEN_CLAIM
+            ) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code="password_changed"
+                )
+
+        return user
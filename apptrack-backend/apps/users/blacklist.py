@@ -0,0 +1,250 @@
+"""
+Fast lookups for blacklisted refresh-token JTIs.
+
+The ``token_blacklist`` tables stay the source of truth. A Bloom filter
+mirrors the JTIs of unexpired blacklisted tokens, so the common case (a
+token that was never blacklisted) is answered without touching the
+database. Positive answers are confirmed against an exact per-JTI entry
+and, failing that, the database.
+
+Two backends are available through ``JWT_BLACKLIST_BACKEND``: ``"redis"``
+keeps the filter in a Redis bitmap shared by all processes, ``"memory"``
+keeps it in the process (single-process deployments and tests). A
+missing filter is built from the database in the background (a Celery
+task for Redis, a thread for the in-process filter) and rebuilt after
+every prune, which also drops expired JTIs; until it is built, lookups go
+to the database, so no request pays for a rebuild.
+"""
+import hashlib
+import logging
+import threading
+import time
+
+import redis
+from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+from redis.exceptions import LockError
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .tasks import rebuild_token_blacklist
+
+logger = logging.getLogger(__name__)
+
+# Bit 0 of the filter is set only by a full rebuild; if Redis loses the
+# bitmap, the recreated one reads as not built yet.
+READY_BIT = 0
+
+
+def bloom_positions(jti, size, hashes):
+    digest = hashlib.blake2b(jti.encode(), digest_size=16).digest()
+    first = int.from_bytes(digest[:8], "big")
+    second = int.from_bytes(digest[8:], "big") | 1
+    # Double hashing; position 0 is reserved for READY_BIT
+    return [1 + (first + i * second) % (size - 1) for i in range(hashes)]
+
+
+def unexpired_blacklist():
+    """``(jti, expires_at)`` of every blacklisted token still valid."""
+    return (
+        BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        .values_list("token__jti", "token__expires_at")
+        .iterator(chunk_size=settings.JWT_BLACKLIST_REBUILD_CHUNK)
+    )
+
+
+class MemoryBlacklist:
+    def __init__(self, size, hashes):
+        self.size = size
+        self.hashes = hashes
+        self._bits = None
+        self._expiry = {}
+        self._lock = threading.Lock()
+        self._builder = None
+        self._builder_lock = threading.Lock()
+
+    def _set(self, bits, jti):
+        for position in bloom_positions(jti, self.size, self.hashes):
+            bits[position // 8] |= 1 << (position % 8)
+
+    def add(self, jti, expires_at):
+        with self._lock:
+            if self._bits is not None:
+                self._set(self._bits, jti)
+                self._expiry[jti] = expires_at.timestamp()
+
+    def check(self, jti):
+        """True/False when known, None when the database must decide."""
+        bits = self._bits
+        if bits is None:
+            self.schedule_rebuild()
+            return None
+        for position in bloom_positions(jti, self.size, self.hashes):
+            if not bits[position // 8] & (1 << (position % 8)):
+                return False
+        expires = self._expiry.get(jti)
+        return None if expires is None else expires > time.time()
+
+    def schedule_rebuild(self):
+        """
+        Build the filter in a background thread.
+
+        The filter lives in this process, so a Celery worker can't build it.
+        """
+        with self._builder_lock:
+            if self._builder is None or not self._builder.is_alive():
+                self._builder = threading.Thread(target=self._build, daemon=True)
+                self._builder.start()
+
+    def _build(self):
+        try:
+            self.rebuild(blocking=False)
+        finally:
+            # The thread's own connection
+            connections.close_all()
+
+    def wait_for_rebuild(self):
+        if self._builder is not None:
+            self._builder.join()
+
+    def rebuild(self, blocking=True):
+        # Held throughout so an add() can't land between the read and the swap
+        if not self._lock.acquire(blocking=blocking):
+            return False
+        try:
+            bits = bytearray(self.size // 8 + 1)
+            expiry = {}
+            for jti, expires_at in unexpired_blacklist():
+                self._set(bits, jti)
+                expiry[jti] = expires_at.timestamp()
+            self._bits, self._expiry = bits, expiry
+        finally:
+            self._lock.release()
+        return True
+
+
+class RedisBlacklist:
+    def __init__(self, url, size, hashes, prefix="jwt:blacklist"):
+        self.client = redis.Redis.from_url(url)
+        self.size = size
+        self.hashes = hashes
+        self.filter_key = f"{prefix}:bloom"
+        self.building_key = f"{prefix}:bloom:building"
+        self.lock_key = f"{prefix}:rebuild-lock"
+        self.queued_key = f"{prefix}:rebuild-queued"
+        self.lock_timeout = settings.JWT_BLACKLIST_REBUILD_LOCK_TIMEOUT
+        self.entry_prefix = f"{prefix}:jti:"
+
+    def _add(self, pipe, key, jti, expires_at):
+        for position in bloom_positions(jti, self.size, self.hashes):
+            pipe.setbit(key, position, 1)
+        pipe.set(self.entry_prefix + jti, 1, exat=int(expires_at.timestamp()) + 1)
+
+    def add(self, jti, expires_at):
+        pipe = self.client.pipeline(transaction=False)
+        self._add(pipe, self.filter_key, jti, expires_at)
+        # Also mark any filter being rebuilt, in case the rebuild has
+        # already read past this token
+        for position in bloom_positions(jti, self.size, self.hashes):
+            pipe.setbit(self.building_key, position, 1)
+        pipe.execute()
+
+    def check(self, jti):
+        """True/False when known, None when the database must decide."""
+        pipe = self.client.pipeline(transaction=False)
+        pipe.getbit(self.filter_key, READY_BIT)
+        for position in bloom_positions(jti, self.size, self.hashes):
+            pipe.getbit(self.filter_key, position)
+        ready, *bits = pipe.execute()
+        if not ready:
+            self.schedule_rebuild()
+            return None
+        if not all(bits):
+            return False
+        # A filter hit: confirm it, deferring to the database if evicted
+        return True if self.client.exists(self.entry_prefix + jti) else None
+
+    def schedule_rebuild(self):
+        """Queue one rebuild task; lookups ask the database until it is done."""
+        # Expires with the rebuild lock, so a lost task is queued again
+        if not self.client.set(self.queued_key, 1, nx=True, ex=self.lock_timeout):
+            return
+        try:
+            rebuild_token_blacklist.delay()
+        except Exception as exc:
+            # Lookups still work from the database; retry on the next one
+            self.client.delete(self.queued_key)
+            logger.warning(f"Could not queue the token blacklist rebuild: {exc}")
+
+    def rebuild(self, blocking=True):
+        """
+        Rebuild the filter from the database; False if another rebuild holds
+        the lock and ``blocking`` is off.
+
+        Rebuilds are serialized: they share ``building_key`` (so ``add()``
+        can reach whichever one is running), and two at once would clear
+        each other's bits before one of them is swapped in as ready.
+        """
+        lock = self.client.lock(
+            self.lock_key,
+            timeout=self.lock_timeout,
+            blocking_timeout=None if blocking else 0,
+        )
+        if not lock.acquire(blocking=blocking):
+            return False
+        try:
+            self.client.delete(self.building_key)
+            pipe = self.client.pipeline(transaction=False)
+            for count, (jti, expires_at) in enumerate(unexpired_blacklist(), start=1):
+                self._add(pipe, self.building_key, jti, expires_at)
+                if count % settings.JWT_BLACKLIST_REBUILD_CHUNK == 0:
+                    pipe.execute()
+            pipe.setbit(self.building_key, READY_BIT, 1)
+            pipe.execute()
+            self.client.rename(self.building_key, self.filter_key)
+            self.client.delete(self.queued_key)
+        finally:
+            try:
+                lock.release()
+            except LockError:
+                # Outlived its timeout; nothing left to release
+                pass
+        return True
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        size = settings.JWT_BLACKLIST_BLOOM_BITS
+        hashes = settings.JWT_BLACKLIST_BLOOM_HASHES
+        if settings.JWT_BLACKLIST_BACKEND == "memory":
+            _backend = MemoryBlacklist(size, hashes)
+        else:
+            _backend = RedisBlacklist(settings.JWT_BLACKLIST_REDIS_URL, size, hashes)
+    return _backend
+
+
+def reset_backend():
+    global _backend
+    if isinstance(_backend, MemoryBlacklist):
+        _backend.wait_for_rebuild()
+    _backend = None
+
+
+def is_blacklisted(jti):
+    known = get_backend().check(jti)
+    if known is None:
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+    return known
+
+
+def add_to_blacklist(jti, expires_at):
+    get_backend().add(jti, expires_at)
+
+
+def rebuild_blacklist(blocking=True):
+    """Rebuild the filter; False if ``blocking`` is off and one is running."""
+    return get_backend().rebuild(blocking=blocking)
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-18 18:10
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="digest_hour",
+            field=models.PositiveSmallIntegerField(
+                default=8, validators=[django.core.validators.MaxValueValidator(23)]
+            ),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="last_digest_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="reminder_delivery",
+            field=models.CharField(
+                choices=[("immediate", "Immediate"), ("digest", "Daily digest")],
+                default="immediate",
+                max_length=20,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                condition=models.Q(("reminder_delivery", "digest")),
+                fields=["timezone", "digest_hour"],
+                name="users_digest_idx",
+            ),
+        ),
+    ]
@@ -1,12 +1,26 @@
 from django.contrib.auth.models import AbstractUser
+from django.core.validators import MaxValueValidator
 from django.db import models
 
 
 class User(AbstractUser):
+    REMINDER_DELIVERY_CHOICES = [
+        ("immediate", "Immediate"),
+        ("digest", "Daily digest"),
+    ]
+
     email = models.EmailField(unique=True)
     first_name = models.CharField(max_length=30)
     last_name = models.CharField(max_length=30)
     timezone = models.CharField(max_length=50, default="Asia/Karachi")
+    reminder_delivery = models.CharField(
+        max_length=20, choices=REMINDER_DELIVERY_CHOICES, default="immediate"
+    )
+    # Local hour (in ``timezone``) the daily digest goes out
+    digest_hour = models.PositiveSmallIntegerField(
+        default=8, validators=[MaxValueValidator(23)]
+    )
+    last_digest_at = models.DateTimeField(null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -16,6 +30,13 @@ class User(AbstractUser):
     class Meta:
         db_table = "users"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["timezone", "digest_hour"],
+                condition=models.Q(reminder_delivery="digest"),
+                name="users_digest_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.email
\ No newline at end of file
@@ -1,3 +1,5 @@
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
@@ -45,11 +47,20 @@ class UserSerializer(serializers.ModelSerializer):
             "first_name",
             "last_name",
             "timezone",
+            "reminder_delivery",
+            "digest_hour",
             "created_at",
             "updated_at",
         )
         read_only_fields = ("id", "email", "created_at", "updated_at")
 
+    def validate_timezone(self, value):
+        try:
+            ZoneInfo(value)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise serializers.ValidationError("Unknown timezone.")
+        return value
+
 
 class TokenObtainSerializer(serializers.Serializer):
     email = serializers.EmailField()
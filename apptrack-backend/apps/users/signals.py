@@ -0,0 +1,22 @@
+from functools import partial
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .authentication import invalidate_user
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and set(update_fields) == {"last_login"}:
+        # Login bookkeeping doesn't affect authentication
+        return
+    # Clear now, and again after commit so a request that re-cached the
+    # pre-commit row in between doesn't keep it.
+    invalidate_user(instance.pk)
+    transaction.on_commit(partial(invalidate_user, instance.pk))
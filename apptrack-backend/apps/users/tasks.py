@@ -0,0 +1,49 @@
+import logging
+
+from django.conf import settings
+from django.utils import timezone
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def prune_expired_tokens():
+    from rest_framework_simplejwt.token_blacklist.models import (
+        BlacklistedToken,
+        OutstandingToken,
+    )
+
+    from .blacklist import rebuild_blacklist
+
+    now = timezone.now()
+    batch_size = settings.TOKEN_PRUNE_BATCH_SIZE
+    pruned = 0
+    for _ in range(settings.TOKEN_PRUNE_MAX_BATCHES):
+        token_ids = list(
+            OutstandingToken.objects.filter(expires_at__lt=now)
+            .order_by("expires_at")
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if not token_ids:
+            break
+        BlacklistedToken.objects.filter(token_id__in=token_ids).delete()
+        OutstandingToken.objects.filter(pk__in=token_ids).delete()
+        pruned += len(token_ids)
+        if len(token_ids) < batch_size:
+            break
+
+    # Start the filter over without the expired JTIs
+    rebuild_blacklist()
+
+    return f"Pruned {pruned} expired tokens"
+
+
+@shared_task
+def rebuild_token_blacklist():
+    from .blacklist import rebuild_blacklist
+
+    if not rebuild_blacklist(blocking=False):
+        return "Token blacklist rebuild already running"
+    return "Rebuilt token blacklist filter"
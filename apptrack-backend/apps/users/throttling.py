@@ -0,0 +1,30 @@
+from rest_framework.throttling import SimpleRateThrottle
+
+from apps.core.throttling import SlidingWindowThrottleMixin
+
+
+class LoginRateThrottle(SlidingWindowThrottleMixin, SimpleRateThrottle):
+    """Login attempts per client address."""
+
+    scope = "login"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": self.get_ident(request),
+        }
+
+
+class LoginAccountRateThrottle(SlidingWindowThrottleMixin, SimpleRateThrottle):
+    """Login attempts per account, whichever addresses they come from."""
+
+    scope = "login_account"
+
+    def get_cache_key(self, request, view):
+        email = request.data.get("email")
+        if not isinstance(email, str) or not email:
+            return None
+        return self.cache_format % {
+            "scope": self.scope,
+            "ident": email.strip().lower(),
+        }
@@ -2,12 +2,13 @@ from rest_framework import generics, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
-from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.views import TokenObtainPairView
 from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
 
 from .serializers import UserRegistrationSerializer, UserSerializer, TokenObtainSerializer
+from .throttling import LoginAccountRateThrottle, LoginRateThrottle
+from .tokens import RefreshToken
 
 User = get_user_model()
 
@@ -20,6 +21,7 @@ class RegisterView(generics.CreateAPIView):
 
 class CustomTokenObtainPairView(TokenObtainPairView):
     permission_classes = [AllowAny]
+    throttle_classes = [LoginRateThrottle, LoginAccountRateThrottle]
 
     def post(self, request, *args, **kwargs):
         serializer = TokenObtainSerializer(data=request.data)
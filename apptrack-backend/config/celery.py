@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.schedules import crontab
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
 
@@ -8,8 +9,32 @@ app.config_from_object("django.conf:settings", namespace="CELERY")
 app.autodiscover_tasks()
 
 app.conf.beat_schedule = {
-    "check-reminders": {
-        "task": "apps.applications.tasks.check_and_send_reminders",
-        "schedule": 60.0,  # Check every minute
+    "dispatch-reminders": {
+        "task": "apps.applications.tasks.dispatch_due_reminders",
+        "schedule": 60.0,  # Every minute (REMINDER_BUCKET_SECONDS)
+    },
+    "send-reminder-digests": {
+        "task": "apps.applications.tasks.send_reminder_digests",
+        "schedule": crontab(minute=0),  # Hourly, on the hour
+    },
+    "archive-sent-reminders": {
+        "task": "apps.applications.tasks.archive_sent_reminders",
+        "schedule": 86400.0,  # Daily
+    },
+    "reconcile-dashboard-rollups": {
+        "task": "apps.applications.tasks.reconcile_dashboard_rollups",
+        "schedule": 3600.0,  # Hourly
+    },
+    "prune-expired-tokens": {
+        "task": "apps.users.tasks.prune_expired_tokens",
+        "schedule": 3600.0,  # Hourly
+    },
+    "collect-attachment-garbage": {
+        "task": "apps.applications.tasks.collect_attachment_garbage",
+        "schedule": 86400.0,  # Daily
+    },
+    "prune-tombstones": {
+        "task": "apps.applications.tasks.prune_tombstones",
+        "schedule": 86400.0,  # Daily
     },
 }
\ No newline at end of file
@@ -112,18 +112,20 @@ AUTH_USER_MODEL = "users.User"
 # REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "apps.core.throttling.SlidingWindowAnonRateThrottle",
+        "apps.core.throttling.SlidingWindowUserRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "100/hour",
         "user": "1000/hour",
+        "login": "10/minute",
+        "login_account": "20/hour",
     },
 }
 
@@ -136,6 +138,9 @@ SIMPLE_JWT = {
         minutes=int(os.getenv("REFRESH_TOKEN_LIFETIME", 1440))
     ),
     "ROTATE_REFRESH_TOKENS": True,
+    "TOKEN_REFRESH_SERIALIZER": (
+        "apps.users.tokens.CachedBlacklistTokenRefreshSerializer"
+    ),
     "BLACKLIST_AFTER_ROTATION": True,
     "UPDATE_LAST_LOGIN": True,
     "ALGORITHM": "HS256",
@@ -160,6 +165,63 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 
+# Cache
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+    }
+}
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", 300))
+
+# Authenticated user cache (shared tier, then a per-process LRU in front).
+# Password hashes are only cached when SIMPLE_JWT["CHECK_REVOKE_TOKEN"] is on.
+USER_CACHE_TIMEOUT = int(os.getenv("USER_CACHE_TIMEOUT", 300))
+USER_CACHE_LOCAL_TTL = int(os.getenv("USER_CACHE_LOCAL_TTL", 5))
+USER_CACHE_LOCAL_SIZE = int(os.getenv("USER_CACHE_LOCAL_SIZE", 1024))
+
+# Maximum operations accepted by /applications/batch/
+APPLICATION_BATCH_LIMIT = int(os.getenv("APPLICATION_BATCH_LIMIT", 100))
+
+# Attachment garbage collection
+ATTACHMENT_GC_GRACE_HOURS = int(os.getenv("ATTACHMENT_GC_GRACE_HOURS", 24))
+ATTACHMENT_GC_BATCH_SIZE = int(os.getenv("ATTACHMENT_GC_BATCH_SIZE", 500))
+
+# CSV import
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 500))
+IMPORT_MAX_ERRORS = int(os.getenv("IMPORT_MAX_ERRORS", 100))
+
+# Refresh-token blacklist lookups ("redis" or "memory")
+JWT_BLACKLIST_BACKEND = os.getenv("JWT_BLACKLIST_BACKEND", "redis")
+JWT_BLACKLIST_REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+JWT_BLACKLIST_BLOOM_BITS = int(os.getenv("JWT_BLACKLIST_BLOOM_BITS", 2**23))
+JWT_BLACKLIST_BLOOM_HASHES = int(os.getenv("JWT_BLACKLIST_BLOOM_HASHES", 7))
+JWT_BLACKLIST_REBUILD_CHUNK = int(os.getenv("JWT_BLACKLIST_REBUILD_CHUNK", 1000))
+JWT_BLACKLIST_REBUILD_LOCK_TIMEOUT = int(
+    os.getenv("JWT_BLACKLIST_REBUILD_LOCK_TIMEOUT", 300)
+)
+TOKEN_PRUNE_BATCH_SIZE = int(os.getenv("TOKEN_PRUNE_BATCH_SIZE", 1000))
+TOKEN_PRUNE_MAX_BATCHES = int(os.getenv("TOKEN_PRUNE_MAX_BATCHES", 100))
+
+# Reminder dispatch
+REMINDER_DISPATCH_BATCH_SIZE = int(os.getenv("REMINDER_DISPATCH_BATCH_SIZE", 100))
+REMINDER_DISPATCH_MAX_BATCHES = int(os.getenv("REMINDER_DISPATCH_MAX_BATCHES", 50))
+REMINDER_LEASE_SECONDS = int(os.getenv("REMINDER_LEASE_SECONDS", 300))
+# How far ahead each dispatch claims; keep in step with the beat interval
+REMINDER_BUCKET_SECONDS = int(os.getenv("REMINDER_BUCKET_SECONDS", 60))
+# Local hour auto-reminders are set for
+REMINDER_AUTO_HOUR = int(os.getenv("REMINDER_AUTO_HOUR", 9))
+REMINDER_ARCHIVE_AFTER_DAYS = int(os.getenv("REMINDER_ARCHIVE_AFTER_DAYS", 90))
+REMINDER_ARCHIVE_BATCH_SIZE = int(os.getenv("REMINDER_ARCHIVE_BATCH_SIZE", 1000))
+
+# Reminder digests
+DIGEST_DEADLINE_DAYS = int(os.getenv("DIGEST_DEADLINE_DAYS", 7))
+DIGEST_BATCH_SIZE = int(os.getenv("DIGEST_BATCH_SIZE", 500))
+
+# Delta sync
+SYNC_CHANGES_LIMIT = int(os.getenv("SYNC_CHANGES_LIMIT", 500))
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.getenv("SYNC_TOMBSTONE_RETENTION_DAYS", 30))
+
 # Email
 EMAIL_BACKEND = os.getenv(
     "EMAIL_BACKEND", "django.core.mail.backends.console.EmailBackend"
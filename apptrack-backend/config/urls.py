@@ -3,10 +3,13 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 
+from apps.core.views import CacheStatsView
+
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/v1/auth/", include("apps.users.urls")),
     path("api/v1/", include("apps.applications.urls")),
+    path("api/v1/cache/stats/", CacheStatsView.as_view(), name="cache-stats"),
 ]
 
 if settings.DEBUG:
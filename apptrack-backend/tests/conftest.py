@@ -1,11 +1,38 @@
-import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+
+import pytest
 from rest_framework.test import APIClient
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from apps.users.authentication import local_users
+from apps.users.blacklist import reset_backend
+
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def locmem_cache(settings):
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    settings.JWT_BLACKLIST_BACKEND = "memory"
+    yield
+    cache.clear()
+    local_users.clear()
+    reset_backend()
+
+
+@pytest.fixture(autouse=True)
+def postgres_only(request):
+    # Raw SQL, JSON containment, full-text search and row locks need Postgres;
+    # everything else also runs on SQLite
+    marker = request.node.get_closest_marker("postgres")
+    if marker and connection.vendor != "postgresql":
+        pytest.skip("requires PostgreSQL")
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -23,6 +50,7 @@ def create_user():
         }
         defaults.update(kwargs)
         return User.objects.create_user(**defaults)
+
     return _create_user
 
 
@@ -32,4 +60,4 @@ def authenticated_client(api_client, create_user):
     refresh = RefreshToken.for_user(user)
     api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
     api_client.user = user
-    return api_client
\ No newline at end of file
+    return api_client
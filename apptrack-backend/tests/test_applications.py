@@ -1,7 +1,16 @@
-import pytest
+from io import StringIO
+from types import SimpleNamespace
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
 from django.urls import reverse
+
+import pytest
 from rest_framework import status
-from apps.applications.models import Application
+
+from apps.applications import tags as tags_module
+from apps.applications.models import Application, StatusHistory
+from apps.applications.rollups import read_rollup
 
 
 @pytest.mark.django_db
@@ -27,16 +36,16 @@ class TestApplications:
             title="My Job",
             organization="My Corp",
         )
-        
+
         # Create application for another user
-        other_user = create_user(email="other@example.com")
+        other_user = create_user(email="other@example.com", username="other")
         Application.objects.create(
             owner=other_user,
             kind="job",
             title="Other Job",
             organization="Other Corp",
         )
-        
+
         url = reverse("application-list")
         response = authenticated_client.get(url)
         assert response.status_code == status.HTTP_200_OK
@@ -54,4 +63,274 @@ class TestApplications:
         data = {"title": "Updated Title"}
         response = authenticated_client.patch(url, data)
         assert response.status_code == status.HTTP_200_OK
-        assert response.data["title"] == "Updated Title"
\ No newline at end of file
+        assert response.data["title"] == "Updated Title"
+
+    def test_list_cursor_pagination(self, authenticated_client):
+        for i in range(3):
+            Application.objects.create(
+                owner=authenticated_client.user,
+                kind="job",
+                title=f"Job {i}",
+                organization="Corp",
+            )
+
+        url = reverse("application-list")
+        response = authenticated_client.get(
+            url, {"pagination": "cursor", "page_size": 2}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert "count" not in response.data
+        assert [a["title"] for a in response.data["results"]] == ["Job 2", "Job 1"]
+
+        response = authenticated_client.get(response.data["next"])
+        assert [a["title"] for a in response.data["results"]] == ["Job 0"]
+        assert response.data["next"] is None
+
+        response = authenticated_client.get(
+            url, {"pagination": "cursor", "include_count": "true"}
+        )
+        assert response.data["count"] == 3
+
+    @pytest.mark.parametrize("pagination", ["cursor", "page"])
+    def test_list_pages_rows_sharing_created_at(self, authenticated_client, pagination):
+        # More than the default PAGE_SIZE, which page-number mode uses since
+        # it ignores ?page_size=
+        for i in range(25):
+            Application.objects.create(
+                owner=authenticated_client.user,
+                kind="job",
+                title=f"Job {i}",
+                organization="Corp",
+            )
+        created_at = Application.objects.first().created_at
+        Application.objects.update(created_at=created_at)
+
+        url = reverse("application-list")
+        response = authenticated_client.get(
+            url, {"pagination": pagination, "page_size": 4}
+        )
+        ids = []
+        pages = 0
+        while True:
+            pages += 1
+            ids += [a["id"] for a in response.data["results"]]
+            if not response.data["next"]:
+                break
+            response = authenticated_client.get(response.data["next"])
+        expected = Application.objects.order_by("-id").values_list("id", flat=True)
+        assert pages > 1
+        assert ids == [str(pk) for pk in expected]
+
+    def test_attachments_count_is_maintained(
+        self, authenticated_client, settings, tmp_path
+    ):
+        settings.MEDIA_ROOT = tmp_path
+        app = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Job",
+            organization="Corp",
+        )
+        url = reverse("attachment-upload", kwargs={"application_id": app.id})
+        upload = SimpleUploadedFile(
+            "cv.pdf", b"%PDF-1.4", content_type="application/pdf"
+        )
+        response = authenticated_client.post(url, {"file": upload, "doc_type": "cv"})
+        assert response.status_code == status.HTTP_201_CREATED
+        app.refresh_from_db()
+        assert app.attachments_count == 1
+
+        attachment = app.attachments.get()
+        url = reverse(
+            "attachment-detail",
+            kwargs={"application_id": app.id, "attachment_id": attachment.id},
+        )
+        response = authenticated_client.delete(url)
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        app.refresh_from_db()
+        assert app.attachments_count == 0
+
+    def test_list_does_not_count_attachments_per_row(
+        self, authenticated_client, django_assert_num_queries
+    ):
+        for i in range(5):
+            Application.objects.create(
+                owner=authenticated_client.user,
+                kind="job",
+                title=f"Job {i}",
+                organization="Corp",
+            )
+
+        url = reverse("application-list")
+        # user lookup, conditional-GET validators, COUNT(*) for the page, page rows
+        with django_assert_num_queries(4):
+            response = authenticated_client.get(url)
+        assert response.data["results"][0]["attachments_count"] == 0
+
+    def test_recount_attachments_repairs_drift(self, authenticated_client):
+        app = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Job",
+            organization="Corp",
+        )
+        Application.objects.filter(pk=app.pk).update(attachments_count=7)
+        call_command("recount_attachments", stdout=StringIO())
+        app.refresh_from_db()
+        assert app.attachments_count == 0
+
+    def test_retrieve_uses_fixed_number_of_queries(
+        self, authenticated_client, django_assert_num_queries
+    ):
+        app = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Job",
+            organization="Corp",
+        )
+        StatusHistory.objects.bulk_create(
+            StatusHistory(
+                application=app,
+                from_status="draft",
+                to_status="submitted",
+                changed_by=authenticated_client.user,
+            )
+            for _ in range(30)
+        )
+
+        url = reverse("application-detail", kwargs={"pk": app.id})
+        # user lookup, application, attachments, history (+ changed_by), reminders
+        with django_assert_num_queries(5):
+            response = authenticated_client.get(url)
+        assert len(response.data["status_history"]) == 20
+        assert response.data["status_history"][0]["changed_by_name"] == "Test User"
+
+        response = authenticated_client.get(url, {"history_limit": 5})
+        assert len(response.data["status_history"]) == 5
+
+    def test_update_returns_new_history_entry(
+        self, authenticated_client, django_assert_num_queries
+    ):
+        app = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Job",
+            organization="Corp",
+        )
+        read_rollup(authenticated_client.user.pk)
+        url = reverse("application-detail", kwargs={"pk": app.id})
+        # user, application, the write and rollup update, then one query per
+        # nested relation: nothing is prefetched before the write
+        with django_assert_num_queries(14):
+            response = authenticated_client.patch(url, {"status": "submitted"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status_history"][0]["to_status"] == "submitted"
+
+    def test_list_conditional_get(self, authenticated_client):
+        Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Job",
+            organization="Corp",
+        )
+        url = reverse("application-list")
+        response = authenticated_client.get(url)
+        etag = response["ETag"]
+        last_modified = response["Last-Modified"]
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        response = authenticated_client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+        # A different query string is a different representation
+        response = authenticated_client.get(
+            url, {"kind": "job"}, HTTP_IF_NONE_MATCH=etag
+        )
+        assert response.status_code == status.HTTP_200_OK
+
+        authenticated_client.post(
+            url, {"kind": "job", "title": "New", "organization": "Corp"}
+        )
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 2
+
+    @pytest.mark.postgres
+    def test_filter_by_tags_any_and_all(self, authenticated_client):
+        for title, tags in [
+            ("A", ["remote", "python"]),
+            ("B", ["remote"]),
+            ("C", ["go"]),
+        ]:
+            Application.objects.create(
+                owner=authenticated_client.user,
+                kind="job",
+                title=title,
+                organization="Corp",
+                tags=tags,
+            )
+        url = reverse("application-list")
+        response = authenticated_client.get(url, {"tags": "remote,python"})
+        assert [a["title"] for a in response.data["results"]] == ["A"]
+
+        response = authenticated_client.get(
+            url, {"tags": "python,go", "tags_match": "any"}
+        )
+        assert sorted(a["title"] for a in response.data["results"]) == ["A", "C"]
+
+    def test_tag_facets(self, authenticated_client, monkeypatch):
+        for tags in [["remote", "python"], ["remote"], []]:
+            Application.objects.create(
+                owner=authenticated_client.user,
+                kind="job",
+                title="Job",
+                organization="Corp",
+                tags=tags,
+            )
+        expected = [{"tag": "remote", "count": 2}, {"tag": "python", "count": 1}]
+        response = authenticated_client.get(reverse("application-tag-facets"))
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == expected
+
+        # The Python fallback used off Postgres gives the same answer
+        monkeypatch.setattr(tags_module, "connection", SimpleNamespace(vendor="sqlite"))
+        queryset = Application.objects.filter(owner=authenticated_client.user)
+        assert tags_module.tag_counts(queryset) == expected
+
+    def test_tags_must_be_strings(self, authenticated_client):
+        url = reverse("application-list")
+        data = {"kind": "job", "title": "Job", "organization": "Corp", "tags": {"a": 1}}
+        response = authenticated_client.post(url, data, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.postgres
+    def test_search_ranks_results(self, authenticated_client):
+        for title, organization, notes in [
+            ("Data Engineer", "Acme", ""),
+            ("Backend Developer", "Python Software Foundation", ""),
+            ("Python Developer", "Initech", "Mostly python work"),
+        ]:
+            Application.objects.create(
+                owner=authenticated_client.user,
+                kind="job",
+                title=title,
+                organization=organization,
+                notes=notes,
+            )
+        url = reverse("application-list")
+        response = authenticated_client.get(url, {"q": "python"})
+        assert [a["title"] for a in response.data["results"]] == [
+            "Python Developer",
+            "Backend Developer",
+        ]
+
+        response = authenticated_client.get(url, {"q": "python", "kind": "scholarship"})
+        assert response.data["count"] == 0
+
+    def test_search_rejects_cursor_pagination(self, authenticated_client):
+        url = reverse("application-list")
+        for params in ({"pagination": "cursor"}, {"cursor": ""}):
+            response = authenticated_client.get(url, {"q": "python", **params})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert "q" in response.data
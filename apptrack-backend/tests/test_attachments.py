@@ -0,0 +1,181 @@
+import hashlib
+import os
+from datetime import timedelta
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+
+from apps.applications import garbage
+from apps.applications.garbage import collect_garbage
+from apps.applications.models import Application, Attachment, AttachmentBlob
+from apps.applications.tasks import collect_attachment_garbage
+
+CV = b"%PDF-1.4 curriculum vitae"
+
+
+@pytest.mark.django_db
+class TestAttachmentBlobs:
+    @pytest.fixture(autouse=True)
+    def media_root(self, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+        return tmp_path
+
+    def upload(self, client, app, content=CV, name="cv.pdf"):
+        url = reverse("attachment-upload", kwargs={"application_id": app.id})
+        upload = SimpleUploadedFile(name, content, content_type="application/pdf")
+        return client.post(url, {"file": upload, "doc_type": "cv"})
+
+    def test_identical_uploads_share_one_blob(self, authenticated_client, media_root):
+        user = authenticated_client.user
+        apps = [
+            Application.objects.create(
+                owner=user, kind="job", title=f"Job {i}", organization="Corp"
+            )
+            for i in range(3)
+        ]
+        for app in apps:
+            assert (
+                self.upload(authenticated_client, app).status_code
+                == status.HTTP_201_CREATED
+            )
+        self.upload(
+            authenticated_client, apps[0], content=b"%PDF-1.4 other", name="other.pdf"
+        )
+
+        digest = hashlib.sha256(CV).hexdigest()
+        blob = AttachmentBlob.objects.get(pk=digest)
+        assert blob.ref_count == 3
+        assert blob.size == len(CV)
+        assert set(blob.attachments.values_list("file", flat=True)) == {blob.file.name}
+        assert blob.file.name == f"attachments/blobs/{digest[:2]}/{digest}.pdf"
+        assert len(list((media_root / "attachments" / "blobs").rglob("*.pdf"))) == 2
+
+        attachment = blob.attachments.get(application=apps[0])
+        response = authenticated_client.delete(
+            reverse(
+                "attachment-detail",
+                kwargs={"application_id": apps[0].id, "attachment_id": attachment.id},
+            )
+        )
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        blob.refresh_from_db()
+        assert blob.ref_count == 2
+
+        # Cascading deletes release their references too
+        Application.objects.filter(pk__in=[app.pk for app in apps[1:]]).delete()
+        blob.refresh_from_db()
+        assert blob.ref_count == 0
+
+    def test_repair_moves_legacy_files_onto_blobs(
+        self, authenticated_client, media_root
+    ):
+        user = authenticated_client.user
+        app = Application.objects.create(
+            owner=user, kind="job", title="Job", organization="Corp"
+        )
+        legacy = [
+            Attachment.objects.create(
+                application=app,
+                file=SimpleUploadedFile("cv.pdf", CV),
+                filename="cv.pdf",
+                file_size=len(CV),
+                content_type="application/pdf",
+                doc_type="cv",
+            )
+            for _ in range(2)
+        ]
+        old_names = [attachment.file.name for attachment in legacy]
+        drifted = AttachmentBlob.objects.create(
+            sha256="0" * 64, file="attachments/blobs/00/unused.pdf", size=1, ref_count=5
+        )
+
+        call_command("repair_attachment_blobs")
+
+        blob = AttachmentBlob.objects.get(pk=hashlib.sha256(CV).hexdigest())
+        assert blob.ref_count == 2
+        assert set(Attachment.objects.values_list("blob", flat=True)) == {blob.pk}
+        assert all(not (media_root / name).exists() for name in old_names)
+        assert (media_root / blob.file.name).read_bytes() == CV
+        drifted.refresh_from_db()
+        assert drifted.ref_count == 0
+
+    def test_garbage_collection(
+        self, authenticated_client, media_root, django_capture_on_commit_callbacks
+    ):
+        user = authenticated_client.user
+        app = Application.objects.create(
+            owner=user, kind="job", title="Job", organization="Corp"
+        )
+        self.upload(authenticated_client, app)
+        self.upload(
+            authenticated_client, app, content=b"%PDF-1.4 kept", name="kept.pdf"
+        )
+        released = AttachmentBlob.objects.get(pk=hashlib.sha256(CV).hexdigest())
+        kept = AttachmentBlob.objects.exclude(pk=released.pk).get()
+        Attachment.objects.filter(blob=released).delete()
+
+        old = timezone.now() - timedelta(days=2)
+        AttachmentBlob.objects.filter(pk=released.pk).update(updated_at=old)
+
+        legacy_dir = media_root / "attachments" / "deleted-app"
+        legacy_dir.mkdir(parents=True)
+        orphan = legacy_dir / "old.pdf"
+        orphan.write_bytes(b"orphan")
+        os.utime(orphan, (old.timestamp(), old.timestamp()))
+        recent = legacy_dir / "recent.pdf"
+        recent.write_bytes(b"in flight")
+        # Old, but its file is still referenced
+        os.utime(media_root / kept.file.name, (old.timestamp(), old.timestamp()))
+
+        call_command("collect_attachment_garbage", "--dry-run")
+        assert AttachmentBlob.objects.filter(pk=released.pk).exists()
+        assert orphan.exists()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            result = collect_attachment_garbage()
+        assert (
+            result == f"Deleted 1 blobs and 1 orphaned files, freed {len(CV) + 6} bytes"
+        )
+
+        assert not AttachmentBlob.objects.filter(pk=released.pk).exists()
+        assert not (media_root / released.file.name).exists()
+        assert not orphan.exists()
+        assert recent.exists()
+        assert (media_root / kept.file.name).exists()
+
+    def test_garbage_collection_repairs_drifted_blobs(
+        self, authenticated_client, media_root
+    ):
+        user = authenticated_client.user
+        app = Application.objects.create(
+            owner=user, kind="job", title="Job", organization="Corp"
+        )
+        self.upload(authenticated_client, app)
+        blob = AttachmentBlob.objects.get()
+        AttachmentBlob.objects.filter(pk=blob.pk).update(
+            ref_count=0, updated_at=timezone.now() - timedelta(days=2)
+        )
+
+        metrics = collect_garbage()
+        assert metrics["blobs_repaired"] == 1
+        assert metrics["blobs_deleted"] == 0
+        blob.refresh_from_db()
+        assert blob.ref_count == 1
+        assert (media_root / blob.file.name).exists()
+
+    def test_garbage_collection_skips_vanished_files(self, media_root, monkeypatch):
+        walk_storage = garbage.walk_storage
+
+        def walk_with_vanished_file(storage, root):
+            yield f"{root}/vanished.pdf"
+            yield from walk_storage(storage, root)
+
+        monkeypatch.setattr(garbage, "walk_storage", walk_with_vanished_file)
+        metrics = collect_garbage()
+        assert metrics["files_scanned"] == 1
+        assert metrics["files_orphaned"] == 0
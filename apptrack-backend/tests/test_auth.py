@@ -1,6 +1,31 @@
-import pytest
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.cache import cache
 from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+import redis
 from rest_framework import status
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import (
+    BlacklistedToken,
+    OutstandingToken,
+)
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from apps.users import blacklist
+from apps.users.authentication import invalidate_user, local_users, user_cache_key
+from apps.users.blacklist import (
+    MemoryBlacklist,
+    RedisBlacklist,
+    is_blacklisted,
+    rebuild_blacklist,
+)
+from apps.users.tasks import prune_expired_tokens, rebuild_token_blacklist
+from apps.users.tokens import RefreshToken
 
 
 @pytest.mark.django_db
@@ -30,10 +55,215 @@ class TestAuthentication:
 
     def test_token_refresh(self, api_client, create_user):
         user = create_user()
-        from rest_framework_simplejwt.tokens import RefreshToken
         refresh = RefreshToken.for_user(user)
         url = reverse("token_refresh")
         data = {"refresh": str(refresh)}
         response = api_client.post(url, data)
         assert response.status_code == status.HTTP_200_OK
-        assert "access" in response.data
\ No newline at end of file
+        assert "access" in response.data
+
+
+@pytest.mark.django_db
+class TestCachedAuthentication:
+    def test_user_lookup_is_cached(
+        self, authenticated_client, django_assert_num_queries
+    ):
+        url = reverse("user_profile")
+        authenticated_client.get(url)
+        with django_assert_num_queries(0):
+            response = authenticated_client.get(url)
+        assert response.data["email"] == authenticated_client.user.email
+
+    def test_shared_cache_backs_the_local_cache(
+        self, authenticated_client, django_assert_num_queries
+    ):
+        url = reverse("user_profile")
+        authenticated_client.get(url)
+        local_users.clear()
+        with django_assert_num_queries(0):
+            authenticated_client.get(url)
+
+    def test_password_hash_is_not_cached(self, authenticated_client, monkeypatch):
+        key = user_cache_key(authenticated_client.user.pk)
+        authenticated_client.get(reverse("user_profile"))
+        assert "password" in cache.get(key).get_deferred_fields()
+
+        # Token revocation compares against the hash on every request
+        monkeypatch.setattr(api_settings, "CHECK_REVOKE_TOKEN", True)
+        invalidate_user(authenticated_client.user.pk)
+        authenticated_client.get(reverse("user_profile"))
+        assert "password" not in cache.get(key).get_deferred_fields()
+
+    def test_profile_update_invalidates(self, authenticated_client):
+        url = reverse("user_profile")
+        authenticated_client.get(url)
+        response = authenticated_client.patch(url, {"first_name": "Changed"})
+        assert response.status_code == status.HTTP_200_OK
+        assert authenticated_client.get(url).data["first_name"] == "Changed"
+
+    def test_password_change_and_deactivation_invalidate(self, authenticated_client):
+        url = reverse("user_profile")
+        user = authenticated_client.user
+        key = user_cache_key(user.pk)
+        authenticated_client.get(url)
+        assert cache.get(key) is not None
+
+        user.set_password("newpass456")
+        user.save()
+        assert cache.get(key) is None
+        assert local_users.get(key) is None
+
+        authenticated_client.get(url)
+        user.is_active = False
+        user.save()
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_unknown_timezone_is_rejected(self, authenticated_client):
+        response = authenticated_client.patch(
+            reverse("user_profile"), {"timezone": "Mars/Olympus"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestTokenBlacklist:
+    def test_rotated_and_logged_out_tokens_are_rejected(
+        self, authenticated_client, create_user
+    ):
+        refresh = RefreshToken.for_user(authenticated_client.user)
+        url = reverse("token_refresh")
+        response = authenticated_client.post(url, {"refresh": str(refresh)})
+        assert response.status_code == status.HTTP_200_OK
+        # The rotated-out token is blacklisted
+        response = authenticated_client.post(url, {"refresh": str(refresh)})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        rotated = RefreshToken.for_user(authenticated_client.user)
+        response = authenticated_client.post(
+            reverse("logout"), {"refresh": str(rotated)}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        response = authenticated_client.post(url, {"refresh": str(rotated)})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_negative_lookups_skip_the_database(
+        self, create_user, django_assert_num_queries
+    ):
+        token = RefreshToken.for_user(create_user())
+        token.blacklist()
+        rebuild_blacklist()
+        with django_assert_num_queries(0):
+            assert not is_blacklisted("never-issued")
+            assert is_blacklisted(token["jti"])
+
+    def test_prune_expired_tokens(self, create_user, settings):
+        settings.TOKEN_PRUNE_BATCH_SIZE = 2
+        user = create_user()
+        past = timezone.now() - timedelta(days=1)
+        expired = [
+            OutstandingToken.objects.create(
+                user=user, jti=f"old-{i}", token="x", expires_at=past
+            )
+            for i in range(3)
+        ]
+        BlacklistedToken.objects.create(token=expired[0])
+        live = OutstandingToken.objects.create(
+            user=user,
+            jti="live",
+            token="x",
+            expires_at=timezone.now() + timedelta(days=1),
+        )
+        BlacklistedToken.objects.create(token=live)
+
+        assert prune_expired_tokens() == "Pruned 3 expired tokens"
+        assert list(OutstandingToken.objects.values_list("jti", flat=True)) == ["live"]
+        assert BlacklistedToken.objects.count() == 1
+
+    @pytest.fixture
+    def redis_backend(self, settings):
+        backend = RedisBlacklist(
+            settings.JWT_BLACKLIST_REDIS_URL, 1024, 5, prefix="test:jwt:blacklist"
+        )
+        try:
+            backend.client.ping()
+        except redis.ConnectionError:
+            pytest.skip("Redis is not available")
+        keys = [
+            backend.filter_key,
+            backend.building_key,
+            backend.lock_key,
+            backend.queued_key,
+        ]
+        backend.client.delete(*keys)
+        yield backend
+        backend.client.delete(*keys)
+
+    def test_redis_backend(self, create_user, redis_backend, monkeypatch):
+        queued = []
+        monkeypatch.setattr(
+            rebuild_token_blacklist, "delay", lambda: queued.append(True)
+        )
+        token = RefreshToken.for_user(create_user())
+        token.blacklist()
+        # Not built yet: lookups queue one rebuild and defer to the database
+        assert redis_backend.check(token["jti"]) is None
+        assert redis_backend.check(token["jti"]) is None
+        assert queued == [True]
+
+        assert redis_backend.rebuild(blocking=False) is True
+        assert not redis_backend.client.exists(redis_backend.queued_key)
+        assert redis_backend.check(token["jti"]) is True
+        assert redis_backend.check("never-issued") is False
+
+        other = RefreshToken.for_user(create_user(email="o@example.com", username="o"))
+        redis_backend.add(other["jti"], datetime_from_epoch(other["exp"]))
+        assert redis_backend.check(other["jti"]) is True
+
+    def test_concurrent_redis_rebuilds_do_not_lose_bits(
+        self, redis_backend, settings, monkeypatch
+    ):
+        settings.JWT_BLACKLIST_REBUILD_CHUNK = 1
+        expires_at = timezone.now() + timedelta(hours=1)
+        jtis = [f"jti-{i}" for i in range(20)]
+
+        def slow_blacklist():
+            for jti in jtis:
+                time.sleep(0.005)
+                yield jti, expires_at
+
+        monkeypatch.setattr(blacklist, "unexpired_blacklist", slow_blacklist)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(lambda _: redis_backend.rebuild(), range(2)))
+
+        assert results == [True, True]
+        assert all(redis_backend.check(jti) is True for jti in jtis)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_memory_backend_builds_in_the_background(
+        self, create_user, django_assert_num_queries
+    ):
+        token = RefreshToken.for_user(create_user())
+        token.blacklist()
+        backend = MemoryBlacklist(1024, 5)
+        with django_assert_num_queries(0):
+            assert backend.check(token["jti"]) is None
+        backend.wait_for_rebuild()
+        assert backend.check(token["jti"]) is True
+        assert backend.check("never-issued") is False
+
+    def test_rebuild_task(self, create_user):
+        token = RefreshToken.for_user(create_user())
+        token.blacklist()
+        assert rebuild_token_blacklist() == "Rebuilt token blacklist filter"
+        assert is_blacklisted(token["jti"])
+
+    def test_lazy_redis_rebuild_skips_while_locked(self, redis_backend, monkeypatch):
+        monkeypatch.setattr(rebuild_token_blacklist, "delay", lambda: None)
+        lock = redis_backend.client.lock(redis_backend.lock_key, timeout=10)
+        assert lock.acquire(blocking=False)
+        try:
+            assert redis_backend.rebuild(blocking=False) is False
+            assert redis_backend.check("never-issued") is None
+        finally:
+            lock.release()
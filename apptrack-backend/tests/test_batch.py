@@ -0,0 +1,106 @@
+import uuid
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.applications.models import Application, StatusHistory, Tombstone
+
+
+@pytest.mark.django_db
+class TestBatch:
+    def test_batch_create_update_delete(self, authenticated_client):
+        user = authenticated_client.user
+        to_update = Application.objects.create(
+            owner=user, kind="job", title="Update me", organization="Corp"
+        )
+        to_delete = Application.objects.create(
+            owner=user, kind="job", title="Delete me", organization="Corp"
+        )
+        operations = [
+            {
+                "op": "create",
+                "data": {"kind": "job", "title": "New", "organization": "Corp"},
+            },
+            {
+                "op": "create",
+                "data": {"kind": "bogus", "title": "Bad", "organization": "Corp"},
+            },
+            {"op": "update", "id": str(to_update.id), "data": {"status": "submitted"}},
+            {"op": "delete", "id": str(to_delete.id)},
+            {"op": "delete", "id": str(uuid.uuid4())},
+        ]
+        response = authenticated_client.post(
+            reverse("application-batch"), {"operations": operations}, format="json"
+        )
+        assert response.status_code == status.HTTP_200_OK
+        results = response.data["results"]
+        assert [r["status"] for r in results] == [
+            "created",
+            "error",
+            "updated",
+            "deleted",
+            "error",
+        ]
+        assert "kind" in results[1]["errors"]
+
+        assert Application.objects.filter(owner=user, title="New").exists()
+        to_update.refresh_from_db()
+        assert to_update.status == "submitted"
+        assert StatusHistory.objects.get(application=to_update).from_status == "draft"
+        assert not Application.objects.filter(pk=to_delete.pk).exists()
+        assert Tombstone.objects.filter(object_id=to_delete.pk).exists()
+
+        summary = authenticated_client.get(reverse("dashboard-summary"))
+        assert summary.data["status_counts"] == {"draft": 1, "submitted": 1}
+
+    @pytest.mark.postgres
+    def test_batch_locks_target_rows(self, authenticated_client):
+        application = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Locked",
+            organization="Corp",
+        )
+        operations = [
+            {"op": "update", "id": str(application.id), "data": {"status": "submitted"}}
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            response = authenticated_client.post(
+                reverse("application-batch"), {"operations": operations}, format="json"
+            )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][0]["status"] == "updated"
+        locks = [
+            query["sql"]
+            for query in queries
+            if query["sql"].startswith('SELECT "applications"')
+            and "FOR UPDATE" in query["sql"]
+        ]
+        assert len(locks) == 1
+        assert StatusHistory.objects.get(application=application).from_status == "draft"
+
+    def test_batch_cannot_touch_other_users_rows(
+        self, authenticated_client, create_user
+    ):
+        other = create_user(email="other@example.com", username="other")
+        app = Application.objects.create(
+            owner=other, kind="job", title="Theirs", organization="Corp"
+        )
+        response = authenticated_client.post(
+            reverse("application-batch"),
+            {"operations": [{"op": "delete", "id": str(app.id)}]},
+            format="json",
+        )
+        assert response.data["results"][0]["status"] == "error"
+        assert Application.objects.filter(pk=app.pk).exists()
+
+    def test_batch_size_is_capped(self, authenticated_client):
+        operations = [{"op": "delete", "id": str(uuid.uuid4())}] * 101
+        response = authenticated_client.post(
+            reverse("application-batch"), {"operations": operations}, format="json"
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
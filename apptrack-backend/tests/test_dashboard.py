@@ -0,0 +1,111 @@
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+
+from apps.applications.models import Application, DashboardRollup
+from apps.applications.tasks import reconcile_dashboard_rollups
+
+
+@pytest.mark.django_db
+class TestDashboard:
+    def create_applications(self, user):
+        for app_status in ["draft", "submitted", "submitted", "offer"]:
+            Application.objects.create(
+                owner=user,
+                kind="job",
+                title=f"{app_status} job",
+                organization="Corp",
+                status=app_status,
+                deadline=date.today() + timedelta(days=3),
+            )
+
+    def test_summary(self, authenticated_client, django_assert_num_queries):
+        self.create_applications(authenticated_client.user)
+        url = reverse("dashboard-summary")
+        response = authenticated_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["status_counts"] == {
+            "draft": 1,
+            "submitted": 2,
+            "offer": 1,
+        }
+        assert response.data["monthly_submissions"] == 2
+        assert response.data["conversion_rate"] == 25.0
+        assert len(response.data["upcoming_deadlines"]) == 4
+
+        # The first read built the rollup; later reads are a primary-key lookup,
+        # and the user now comes from the auth cache.
+        # conditional-GET validators, deadline listing, rollup
+        cache.clear()
+        with django_assert_num_queries(3):
+            authenticated_client.get(url)
+
+    def test_summary_sections(self, authenticated_client):
+        self.create_applications(authenticated_client.user)
+        url = reverse("dashboard-summary")
+        response = authenticated_client.get(url, {"sections": "conversion_rate"})
+        assert response.data == {"conversion_rate": 25.0}
+
+        response = authenticated_client.get(url, {"sections": "bogus"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_rollup_follows_api_writes(self, authenticated_client):
+        summary_url = reverse("dashboard-summary")
+        authenticated_client.get(summary_url)
+
+        response = authenticated_client.post(
+            reverse("application-list"),
+            {"kind": "job", "title": "Job", "organization": "Corp", "status": "draft"},
+        )
+        detail_url = reverse("application-detail", kwargs={"pk": response.data["id"]})
+        authenticated_client.patch(detail_url, {"status": "submitted"})
+
+        response = authenticated_client.get(summary_url)
+        assert response.data["status_counts"] == {"submitted": 1}
+        assert response.data["monthly_submissions"] == 1
+
+        authenticated_client.delete(detail_url)
+        response = authenticated_client.get(summary_url)
+        assert response.data["status_counts"] == {}
+        assert response.data["monthly_submissions"] == 0
+        assert response.data["conversion_rate"] == 0
+
+    def test_reconcile_rebuilds_drifted_rollups(self, authenticated_client):
+        user = authenticated_client.user
+        self.create_applications(user)
+        authenticated_client.get(reverse("dashboard-summary"))
+        DashboardRollup.objects.filter(owner=user).update(total=99, status_counts={})
+
+        assert reconcile_dashboard_rollups() == "Rebuilt 1 dashboard rollups"
+        rollup = DashboardRollup.objects.get(owner=user)
+        assert rollup.total == 4
+        assert rollup.status_counts == {"draft": 1, "submitted": 2, "offer": 1}
+
+    def test_summary_is_cached_until_a_write(self, authenticated_client):
+        url = reverse("dashboard-summary")
+        assert authenticated_client.get(url)["X-Cache"] == "MISS"
+        assert authenticated_client.get(url)["X-Cache"] == "HIT"
+
+        authenticated_client.post(
+            reverse("application-list"),
+            {"kind": "job", "title": "Job", "organization": "Corp"},
+        )
+        response = authenticated_client.get(url)
+        assert response["X-Cache"] == "MISS"
+        assert response.data["status_counts"] == {"draft": 1}
+
+    def test_summary_cache_expires_with_the_date(
+        self, authenticated_client, monkeypatch
+    ):
+        url = reverse("dashboard-summary")
+        assert authenticated_client.get(url)["X-Cache"] == "MISS"
+        assert authenticated_client.get(url)["X-Cache"] == "HIT"
+
+        tomorrow = timezone.localdate() + timedelta(days=1)
+        monkeypatch.setattr(timezone, "localdate", lambda *args, **kwargs: tomorrow)
+        assert authenticated_client.get(url)["X-Cache"] == "MISS"
@@ -0,0 +1,134 @@
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+from freezegun import freeze_time
+
+from apps.applications.digests import digest_users, send_digests
+from apps.applications.models import Application, Reminder
+from apps.applications.tasks import (
+    dispatch_due_reminders,
+    send_reminder_batch,
+    send_reminder_digests,
+)
+
+# 08:30 in Asia/Karachi (UTC+5)
+NOW = datetime(2030, 1, 10, 3, 30, tzinfo=dt_timezone.utc)
+
+
+@pytest.mark.django_db
+class TestDigests:
+    @pytest.fixture
+    def digest_user(self, create_user):
+        return create_user(
+            reminder_delivery="digest", timezone="Asia/Karachi", digest_hour=8
+        )
+
+    def test_digest_groups_reminders_and_deadlines(
+        self, digest_user, create_user, mailoutbox, monkeypatch
+    ):
+        reminded = Application.objects.create(
+            owner=digest_user, kind="job", title="Engineer", organization="Corp"
+        )
+        reminder = Reminder.objects.create(
+            application=reminded, remind_at=NOW - timedelta(hours=1)
+        )
+        Application.objects.create(
+            owner=digest_user,
+            kind="job",
+            title="Analyst",
+            organization="Bank",
+            deadline=date(2030, 1, 13),
+        )
+        Application.objects.create(
+            owner=digest_user,
+            kind="job",
+            title="Later",
+            organization="Far",
+            deadline=date(2030, 3, 1),
+        )
+
+        other = create_user(email="other@example.com", username="other")
+        other_app = Application.objects.create(
+            owner=other, kind="job", title="Other", organization="Elsewhere"
+        )
+        Reminder.objects.create(
+            application=other_app, remind_at=NOW - timedelta(hours=1)
+        )
+
+        with freeze_time(NOW):
+            # Digest users' reminders are left to the digest
+            batches = []
+            monkeypatch.setattr(
+                send_reminder_batch,
+                "apply_async",
+                lambda args, task_id, eta: batches.append(args[0]),
+            )
+            dispatch_due_reminders()
+            assert len(batches) == 1 and len(batches[0]) == 1
+
+            assert send_reminder_digests() == "Sent 1 digests"
+            # Only one digest per local day
+            assert send_reminder_digests() == "Sent 0 digests"
+
+        assert len(mailoutbox) == 1
+        body = mailoutbox[0].body
+        assert mailoutbox[0].to == [digest_user.email]
+        assert "Engineer at Corp" in body
+        assert "2030-01-13: Analyst at Bank" in body
+        assert "Later" not in body
+
+        reminder.refresh_from_db()
+        assert reminder.is_sent
+        digest_user.refresh_from_db()
+        assert digest_user.last_digest_at == NOW
+
+    def test_digest_waits_for_local_hour(self, digest_user, mailoutbox):
+        app = Application.objects.create(
+            owner=digest_user, kind="job", title="Engineer", organization="Corp"
+        )
+        Reminder.objects.create(application=app, remind_at=NOW - timedelta(hours=3))
+
+        with freeze_time(NOW - timedelta(hours=1)):
+            assert send_reminder_digests() == "Sent 0 digests"
+        with freeze_time(NOW):
+            assert send_reminder_digests() == "Sent 1 digests"
+
+    def test_digest_batch_uses_fixed_number_of_queries(
+        self, digest_user, create_user, django_assert_num_queries
+    ):
+        users = [digest_user] + [
+            create_user(
+                email=f"u{i}@example.com", username=f"u{i}", reminder_delivery="digest"
+            )
+            for i in range(3)
+        ]
+        for user in users:
+            app = Application.objects.create(
+                owner=user, kind="job", title="Job", organization="Org"
+            )
+            Reminder.objects.create(application=app, remind_at=NOW - timedelta(hours=1))
+
+        local_dates = {user.pk: date(2030, 1, 10) for user in users}
+        # Items, users, mark reminders sent, stamp users
+        with django_assert_num_queries(4):
+            assert send_digests(local_dates, NOW) == 4
+
+    def test_digest_users_scan_each_timezone_once(self, digest_user, create_user):
+        others = [
+            create_user(
+                email=f"u{i}@example.com",
+                username=f"u{i}",
+                reminder_delivery="digest",
+                timezone="Asia/Karachi",
+            )
+            for i in range(3)
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            due = digest_users(NOW)
+        assert set(due) == {digest_user.pk} | {user.pk for user in others}
+        # One clause for the one timezone, not one per user
+        assert queries[1]["sql"].count("Asia/Karachi") == 1
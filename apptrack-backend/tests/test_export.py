@@ -0,0 +1,65 @@
+import csv
+import io
+import json
+
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.applications.models import Application, StatusHistory
+
+
+@pytest.mark.django_db
+class TestExport:
+    def create_applications(self, user):
+        app = Application.objects.create(
+            owner=user,
+            kind="job",
+            title="Engineer",
+            organization="Corp",
+            tags=["remote", "python"],
+        )
+        StatusHistory.objects.create(
+            application=app, from_status="draft", to_status="submitted"
+        )
+        Application.objects.create(
+            owner=user, kind="scholarship", title="Grant", organization="Uni"
+        )
+
+    def test_csv_export(self, authenticated_client):
+        self.create_applications(authenticated_client.user)
+        response = authenticated_client.get(
+            reverse("application-export"),
+            {"format": "csv", "include_history_count": "true"},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        body = b"".join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(body)))
+        assert [row["title"] for row in rows] == ["Grant", "Engineer"]
+        assert rows[1]["tags"] == "remote;python"
+        assert rows[1]["history_count"] == "1"
+
+    def test_ndjson_export_honors_filters(self, authenticated_client):
+        self.create_applications(authenticated_client.user)
+        response = authenticated_client.get(
+            reverse("application-export"), {"format": "ndjson", "kind": "job"}
+        )
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        assert [row["title"] for row in rows] == ["Engineer"]
+        assert rows[0]["tags"] == ["remote", "python"]
+        assert "history_count" not in rows[0]
+
+    def test_export_errors_are_json(self, authenticated_client):
+        url = reverse("application-export")
+        response = APIClient().get(url, {"format": "csv"})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert response["Content-Type"] == "application/json"
+        assert "detail" in json.loads(response.content)
+
+        response = authenticated_client.get(url, {"format": "json"})
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "detail" in json.loads(response.content)
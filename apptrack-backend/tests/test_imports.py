@@ -0,0 +1,64 @@
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.applications.models import Application, ImportJob
+from apps.applications.tasks import import_applications
+
+CSV = b"""kind,title,organization,deadline,tags
+job,Engineer,Corp,2030-01-01,remote;python
+job,Engineer,corp ,,
+scholarship,Grant,Uni,,
+bogus,Broken,Corp,,
+job,Existing,Acme,,
+"""
+
+
+@pytest.mark.django_db
+class TestImports:
+    def test_import_csv(self, authenticated_client, settings, tmp_path):
+        settings.MEDIA_ROOT = tmp_path
+        settings.IMPORT_BATCH_SIZE = 2
+        user = authenticated_client.user
+        Application.objects.create(
+            owner=user, kind="job", title="Existing", organization="Acme"
+        )
+
+        upload = SimpleUploadedFile("apps.csv", CSV, content_type="text/csv")
+        response = authenticated_client.post(
+            reverse("application-import-csv"), {"file": upload}
+        )
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert response.data["status"] == "pending"
+
+        job_id = response.data["id"]
+        import_applications(job_id)
+
+        response = authenticated_client.get(
+            reverse("import-job-detail", kwargs={"pk": job_id})
+        )
+        assert response.data["status"] == "completed"
+        assert response.data["processed_rows"] == 5
+        assert response.data["created_count"] == 2
+        assert response.data["duplicate_count"] == 2
+        assert response.data["error_count"] == 1
+        assert response.data["errors"][0]["row"] == 5
+
+        engineer = Application.objects.get(owner=user, title="Engineer")
+        assert engineer.tags == ["remote", "python"]
+        assert str(engineer.deadline) == "2030-01-01"
+
+    def test_import_job_is_private(
+        self, authenticated_client, create_user, settings, tmp_path
+    ):
+        settings.MEDIA_ROOT = tmp_path
+        other = create_user(email="other@example.com", username="other")
+        job = ImportJob.objects.create(
+            owner=other, file=SimpleUploadedFile("a.csv", b"kind\\n")
+        )
+        response = authenticated_client.get(
+            reverse("import-job-detail", kwargs={"pk": job.id})
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
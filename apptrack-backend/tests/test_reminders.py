@@ -1,8 +1,22 @@
-import pytest
+import socket
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+
 from django.urls import reverse
+from django.utils import timezone
+
+import pytest
 from rest_framework import status
-from datetime import datetime, timedelta
-from apps.applications.models import Application, Reminder
+
+from apps.applications import tasks
+from apps.applications.models import Application, ArchivedReminder, Reminder, Tombstone
+from apps.applications.reminders import claim_due_reminders
+from apps.applications.tasks import (
+    archive_sent_reminders,
+    dispatch_due_reminders,
+    schedule_reminder,
+    send_reminder_batch,
+)
 
 
 @pytest.mark.django_db
@@ -23,4 +37,326 @@ class TestReminders:
         }
         response = authenticated_client.post(url, data)
         assert response.status_code == status.HTTP_201_CREATED
-        assert "scheduled_task_id" in response.data
\ No newline at end of file
+        assert "scheduled_task_id" in response.data
+
+    def test_create_reminder_dispatches_after_commit(
+        self, authenticated_client, monkeypatch, django_capture_on_commit_callbacks
+    ):
+        app = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Test Job",
+            organization="Test Corp",
+        )
+        url = reverse("reminder-list-create", kwargs={"application_id": app.id})
+        dispatched = []
+        monkeypatch.setattr(
+            dispatch_due_reminders, "delay", lambda: dispatched.append(1)
+        )
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.post(
+                url,
+                {
+                    "application": str(app.id),
+                    "remind_at": (timezone.now() + timedelta(days=1)).isoformat(),
+                },
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert dispatched == []
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = authenticated_client.post(
+                url,
+                {
+                    "application": str(app.id),
+                    "remind_at": timezone.now().isoformat(),
+                },
+            )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert dispatched == [1]
+
+    def test_cannot_create_reminder_for_another_users_application(
+        self, authenticated_client, create_user
+    ):
+        other = create_user(email="other@example.com", username="other")
+        app = Application.objects.create(
+            owner=other, kind="job", title="Test Job", organization="Test Corp"
+        )
+        response = authenticated_client.post(
+            reverse("all-reminders"),
+            {
+                "application": str(app.id),
+                "remind_at": (datetime.now() + timedelta(days=1)).isoformat(),
+            },
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Reminder.objects.exists()
+
+    def test_auto_reminders_before_deadlines(self, authenticated_client):
+        user = authenticated_client.user
+        today = timezone.localdate(timezone.now(), ZoneInfo(user.timezone))
+        far = Application.objects.create(
+            owner=user,
+            kind="job",
+            title="Far",
+            organization="Corp",
+            deadline=today + timedelta(days=10),
+        )
+        near = Application.objects.create(
+            owner=user,
+            kind="job",
+            title="Near",
+            organization="Corp",
+            deadline=today + timedelta(days=3),
+        )
+        Application.objects.create(
+            owner=user, kind="job", title="None", organization="Corp"
+        )
+        Application.objects.create(
+            owner=user,
+            kind="job",
+            title="Past",
+            organization="Corp",
+            deadline=today - timedelta(days=1),
+        )
+
+        url = reverse("auto-reminders")
+        response = authenticated_client.post(
+            url, {"days_before": [7, 1]}, format="json"
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["created"] == 3
+        # Near's 7-days-before reminder would already be in the past
+        assert response.data["skipped"] == 1
+        assert Reminder.objects.filter(application=far).count() == 2
+        reminder = Reminder.objects.get(application=near)
+        local = reminder.remind_at.astimezone(ZoneInfo(user.timezone))
+        assert local.date() == near.deadline - timedelta(days=1)
+        assert local.hour == 9
+
+        # Re-running does not duplicate reminders
+        response = authenticated_client.post(
+            url, {"days_before": [7, 1]}, format="json"
+        )
+        assert response.data["created"] == 0
+        assert response.data["skipped"] == 4
+
+        response = authenticated_client.post(
+            url, {"days_before": [2], "application_ids": [str(near.id)]}, format="json"
+        )
+        assert response.data["created"] == 1
+        assert response.data["skipped"] == 0
+        assert Reminder.objects.count() == 4
+
+
+@pytest.mark.django_db
+class TestReminderDispatch:
+    @pytest.fixture
+    def application(self, create_user):
+        user = create_user()
+        return Application.objects.create(
+            owner=user, kind="job", title="Test Job", organization="Test Corp"
+        )
+
+    def test_dispatch_claims_due_reminders_in_batches(
+        self, application, settings, monkeypatch
+    ):
+        settings.REMINDER_DISPATCH_BATCH_SIZE = 2
+        now = timezone.now()
+        due = [
+            Reminder.objects.create(
+                application=application, remind_at=now - timedelta(minutes=i)
+            )
+            for i in range(1, 4)
+        ]
+        Reminder.objects.create(
+            application=application, remind_at=now + timedelta(days=1)
+        )
+        Reminder.objects.create(
+            application=application, remind_at=now - timedelta(hours=1), is_sent=True
+        )
+
+        batches = []
+        monkeypatch.setattr(
+            tasks.send_reminder_batch,
+            "apply_async",
+            lambda args, task_id, eta: batches.append((args[0], task_id, eta)),
+        )
+
+        assert tasks.dispatch_due_reminders() == "Dispatched 3 reminders"
+        assert [len(ids) for ids, _, _ in batches] == [2, 1]
+        assert sorted(sum((ids for ids, _, _ in batches), [])) == sorted(
+            str(r.id) for r in due
+        )
+        assert all(eta is None for _, _, eta in batches)
+        for ids, task_id, _ in batches:
+            assert set(
+                Reminder.objects.filter(pk__in=ids).values_list(
+                    "scheduled_task_id", flat=True
+                )
+            ) == {task_id}
+
+        # Claimed reminders are not handed out again while the lease holds
+        batches.clear()
+        assert tasks.dispatch_due_reminders() == "Dispatched 0 reminders"
+        assert batches == []
+
+    def test_dispatch_only_materializes_the_next_bucket(
+        self, application, settings, monkeypatch
+    ):
+        now = timezone.now()
+        soon = Reminder.objects.create(
+            application=application,
+            remind_at=now + timedelta(seconds=settings.REMINDER_BUCKET_SECONDS // 2),
+        )
+        later = Reminder.objects.create(
+            application=application,
+            remind_at=now + timedelta(seconds=settings.REMINDER_BUCKET_SECONDS * 2),
+        )
+
+        batches = []
+        monkeypatch.setattr(
+            tasks.send_reminder_batch,
+            "apply_async",
+            lambda args, task_id, eta: batches.append((args[0], eta)),
+        )
+
+        assert tasks.dispatch_due_reminders() == "Dispatched 1 reminders"
+        assert batches == [([str(soon.id)], soon.remind_at)]
+        later.refresh_from_db()
+        assert later.claimed_at is None
+
+    def test_expired_lease_is_reclaimed(self, application, settings):
+        now = timezone.now()
+        reminder = Reminder.objects.create(
+            application=application, remind_at=now - timedelta(minutes=10)
+        )
+        Reminder.objects.filter(pk=reminder.pk).update(
+            claimed_at=now - timedelta(seconds=settings.REMINDER_LEASE_SECONDS + 1)
+        )
+        _, rows = claim_due_reminders(10)
+        assert rows == [(reminder.id, reminder.remind_at)]
+        assert claim_due_reminders(10)[1] == []
+
+    def test_send_reminder_batch(
+        self, application, mailoutbox, django_assert_num_queries
+    ):
+        reminders = [
+            Reminder.objects.create(
+                application=application, remind_at=timezone.now() - timedelta(minutes=1)
+            )
+            for _ in range(3)
+        ]
+        task_id, rows = claim_due_reminders(10)
+        ids = [str(pk) for pk, _ in rows]
+
+        # One select for the batch, one bulk update
+        with django_assert_num_queries(2):
+            result = send_reminder_batch.apply(args=[ids], task_id=task_id).get()
+        assert result == "Sent 3 of 3 reminders"
+        assert len(mailoutbox) == 3
+        assert {tuple(message.to) for message in mailoutbox} == {
+            (application.owner.email,)
+        }
+        assert all(
+            reminder.is_sent
+            for reminder in Reminder.objects.filter(pk__in=[r.pk for r in reminders])
+        )
+
+        # A legacy ETA task for the same reminder does nothing
+        assert schedule_reminder(ids[0]) == "Already sent or claimed"
+        assert len(mailoutbox) == 3
+
+    def test_late_batch_skips_reclaimed_reminders(
+        self, application, mailoutbox, settings
+    ):
+        now = timezone.now()
+        Reminder.objects.create(
+            application=application, remind_at=now - timedelta(minutes=1)
+        )
+        stale_task_id, rows = claim_due_reminders(10, now=now)
+        ids = [str(pk) for pk, _ in rows]
+
+        # The first worker never ran; its lease expired and another dispatch
+        # re-claimed the reminder
+        later = now + timedelta(seconds=settings.REMINDER_LEASE_SECONDS + 1)
+        task_id, rows = claim_due_reminders(10, now=later)
+        assert [str(pk) for pk, _ in rows] == ids
+
+        result = send_reminder_batch.apply(args=[ids], task_id=stale_task_id).get()
+        assert result == "Sent 0 of 1 reminders"
+        assert mailoutbox == []
+
+        result = send_reminder_batch.apply(args=[ids], task_id=task_id).get()
+        assert result == "Sent 1 of 1 reminders"
+        assert len(mailoutbox) == 1
+
+    def test_send_reminder_batch_over_one_smtp_session(self, application, settings):
+        aiosmtpd = pytest.importorskip("aiosmtpd.controller")
+
+        class Handler:
+            def __init__(self):
+                self.sessions = set()
+                self.messages = 0
+
+            async def handle_DATA(self, server, session, envelope):
+                self.sessions.add(id(session))
+                self.messages += 1
+                return "250 OK"
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        handler = Handler()
+        controller = aiosmtpd.Controller(handler, hostname="127.0.0.1", port=port)
+        controller.start()
+        try:
+            settings.EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+            settings.EMAIL_HOST = "127.0.0.1"
+            settings.EMAIL_PORT = port
+            settings.EMAIL_USE_TLS = False
+            settings.EMAIL_HOST_USER = ""
+
+            for _ in range(3):
+                Reminder.objects.create(
+                    application=application, remind_at=timezone.now()
+                )
+            task_id, rows = claim_due_reminders(10)
+            ids = [str(pk) for pk, _ in rows]
+            result = send_reminder_batch.apply(args=[ids], task_id=task_id).get()
+            assert result == "Sent 3 of 3 reminders"
+        finally:
+            controller.stop()
+
+        assert handler.messages == 3
+        assert len(handler.sessions) == 1
+
+    @pytest.mark.postgres
+    def test_archive_moves_old_sent_reminders(self, application, settings):
+        settings.REMINDER_ARCHIVE_BATCH_SIZE = 1
+        old = timezone.now() - timedelta(days=settings.REMINDER_ARCHIVE_AFTER_DAYS + 1)
+        archived = [
+            Reminder.objects.create(
+                application=application, remind_at=old, is_sent=True
+            )
+            for _ in range(2)
+        ]
+        unsent = Reminder.objects.create(application=application, remind_at=old)
+        recent = Reminder.objects.create(
+            application=application, remind_at=timezone.now(), is_sent=True
+        )
+
+        assert archive_sent_reminders() == "Archived 2 reminders"
+        assert set(Reminder.objects.values_list("id", flat=True)) == {
+            unsent.id,
+            recent.id,
+        }
+        assert set(ArchivedReminder.objects.values_list("id", flat=True)) == {
+            r.id for r in archived
+        }
+        assert set(
+            Tombstone.objects.filter(kind="reminder").values_list(
+                "object_id", flat=True
+            )
+        ) == {r.id for r in archived}
@@ -0,0 +1,104 @@
+from datetime import timedelta
+
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+
+from apps.applications.models import Application, Reminder
+from apps.applications.sync import encode_cursor
+
+
+@pytest.mark.django_db
+class TestChanges:
+    def test_initial_sync_returns_everything(self, authenticated_client):
+        app = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Job",
+            organization="Corp",
+        )
+        Reminder.objects.create(application=app, remind_at=timezone.now())
+
+        response = authenticated_client.get(reverse("application-changes"))
+        assert response.status_code == status.HTTP_200_OK
+        assert [a["id"] for a in response.data["applications"]] == [str(app.id)]
+        assert len(response.data["reminders"]) == 1
+        assert response.data["deleted"] == []
+        assert response.data["has_more"] is False
+
+    def test_changes_since_cursor_include_tombstones(self, authenticated_client):
+        url = reverse("application-changes")
+        old = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Old",
+            organization="Corp",
+        )
+        Application.objects.filter(pk=old.pk).update(
+            updated_at=timezone.now() - timedelta(minutes=5)
+        )
+        doomed = Application.objects.create(
+            owner=authenticated_client.user,
+            kind="job",
+            title="Doomed",
+            organization="Corp",
+        )
+        cursor = encode_cursor(timezone.now() - timedelta(minutes=1))
+
+        authenticated_client.delete(
+            reverse("application-detail", kwargs={"pk": doomed.id})
+        )
+        response = authenticated_client.get(url, {"since": cursor})
+        assert response.data["applications"] == []
+        assert response.data["deleted"][0]["kind"] == "application"
+        assert response.data["deleted"][0]["object_id"] == str(doomed.id)
+
+    def test_truncated_changes_resume_from_cursor(self, authenticated_client, settings):
+        settings.SYNC_CHANGES_LIMIT = 2
+        for i in range(3):
+            Application.objects.create(
+                owner=authenticated_client.user,
+                kind="job",
+                title=f"Job {i}",
+                organization="Corp",
+            )
+        url = reverse("application-changes")
+        response = authenticated_client.get(url)
+        assert response.data["has_more"] is True
+        assert [a["title"] for a in response.data["applications"]] == ["Job 0", "Job 1"]
+
+        response = authenticated_client.get(url, {"since": response.data["cursor"]})
+        assert response.data["has_more"] is False
+        assert [a["title"] for a in response.data["applications"]] == ["Job 2"]
+
+    def test_truncated_changes_page_through_shared_timestamp(
+        self, authenticated_client, settings
+    ):
+        settings.SYNC_CHANGES_LIMIT = 2
+        for i in range(5):
+            Application.objects.create(
+                owner=authenticated_client.user,
+                kind="job",
+                title=f"Job {i}",
+                organization="Corp",
+            )
+        Application.objects.update(updated_at=timezone.now())
+        url = reverse("application-changes")
+        titles = []
+        params = {}
+        for _ in range(5):
+            response = authenticated_client.get(url, params)
+            titles += [a["title"] for a in response.data["applications"]]
+            if not response.data["has_more"]:
+                break
+            params = {"since": response.data["cursor"]}
+        assert response.data["has_more"] is False
+        assert sorted(titles) == [f"Job {i}" for i in range(5)]
+
+    def test_expired_or_invalid_cursor(self, authenticated_client):
+        url = reverse("application-changes")
+        expired = encode_cursor(timezone.now() - timedelta(days=365))
+        assert authenticated_client.get(url, {"since": expired}).status_code == 410
+        assert authenticated_client.get(url, {"since": "nope"}).status_code == 400
@@ -0,0 +1,81 @@
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+from apps.core.throttling import SlidingWindowAnonRateThrottle
+
+
+class FakeClock:
+    def __init__(self, now):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def anonymous_request():
+    request = APIRequestFactory().get("/")
+    request.user = AnonymousUser()
+    return request
+
+
+def make_throttle(clock, rate="10/minute"):
+    class Throttle(SlidingWindowAnonRateThrottle):
+        timer = clock
+
+        def get_rate(self):
+            return rate
+
+    return Throttle()
+
+
+class TestSlidingWindowThrottle:
+    def test_limits_within_window(self):
+        clock = FakeClock(60_000.0)
+        request = anonymous_request()
+
+        results = [make_throttle(clock).allow_request(request, None) for _ in range(11)]
+        assert results == [True] * 10 + [False]
+
+    def test_previous_window_slides_out(self):
+        clock = FakeClock(60_000.0)
+        request = anonymous_request()
+        for _ in range(10):
+            assert make_throttle(clock).allow_request(request, None)
+
+        # Halfway through the next window half of the old count still applies
+        clock.now += 90
+        allowed = 0
+        throttle = make_throttle(clock)
+        while throttle.allow_request(request, None):
+            allowed += 1
+            throttle = make_throttle(clock)
+        assert allowed == 5
+        assert 0 < throttle.wait() <= 30
+
+    def test_counters_are_fixed_size(self):
+        clock = FakeClock(60_000.0)
+        request = anonymous_request()
+        throttle = make_throttle(clock, rate="1000/minute")
+        for _ in range(50):
+            throttle.allow_request(request, None)
+        assert cache.get(f"{throttle.key}:{int(60_000 // 60)}") == 50
+
+
+@pytest.mark.django_db
+class TestLoginThrottle:
+    def test_login_is_throttled(self, api_client, create_user, settings):
+        create_user(email="login@example.com", password="loginpass123")
+        url = reverse("token_obtain_pair")
+        data = {"email": "login@example.com", "password": "wrong"}
+
+        for _ in range(10):
+            response = api_client.post(url, data)
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        response = api_client.post(url, data)
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response
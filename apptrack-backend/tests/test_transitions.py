@@ -0,0 +1,91 @@
+from django.urls import reverse
+
+import pytest
+from rest_framework import status
+
+from apps.applications.models import Application, StatusHistory
+
+
+@pytest.mark.django_db
+class TestTransitions:
+    def create_application(self, user, app_status="draft"):
+        return Application.objects.create(
+            owner=user, kind="job", title="Job", organization="Corp", status=app_status
+        )
+
+    @pytest.mark.postgres
+    def test_transition_updates_status_and_history(self, authenticated_client):
+        app = self.create_application(authenticated_client.user)
+        url = reverse("application-transition", kwargs={"pk": app.id})
+        response = authenticated_client.post(
+            url, {"to_status": "submitted", "note": "Sent"}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["from_status"] == "draft"
+
+        app.refresh_from_db()
+        assert app.status == "submitted"
+        history = StatusHistory.objects.get(application=app)
+        assert (history.from_status, history.to_status, history.note) == (
+            "draft",
+            "submitted",
+            "Sent",
+        )
+        assert history.changed_by == authenticated_client.user
+
+        summary = authenticated_client.get(reverse("dashboard-summary"))
+        assert summary.data["status_counts"] == {"submitted": 1}
+
+    @pytest.mark.postgres
+    def test_stale_expected_status_conflicts(self, authenticated_client):
+        app = self.create_application(authenticated_client.user, "submitted")
+        url = reverse("application-transition", kwargs={"pk": app.id})
+        response = authenticated_client.post(
+            url, {"from_status": "draft", "to_status": "submitted"}
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.data["status"] == "submitted"
+        assert not StatusHistory.objects.exists()
+
+    def test_disallowed_transition(self, authenticated_client):
+        app = self.create_application(authenticated_client.user, "rejected")
+        url = reverse("application-transition", kwargs={"pk": app.id})
+        response = authenticated_client.post(url, {"to_status": "offer"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    @pytest.mark.postgres
+    def test_other_users_application_is_not_found(
+        self, authenticated_client, create_user
+    ):
+        other = create_user(email="other@example.com", username="other")
+        app = self.create_application(other)
+        url = reverse("application-transition", kwargs={"pk": app.id})
+        response = authenticated_client.post(
+            url, {"from_status": "draft", "to_status": "submitted"}
+        )
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        app.refresh_from_db()
+        assert app.status == "draft"
+
+    @pytest.mark.postgres
+    def test_bulk_transition(self, authenticated_client):
+        user = authenticated_client.user
+        first = self.create_application(user)
+        second = self.create_application(user, "interview")
+        transitions = [
+            {"id": str(first.id), "from_status": "draft", "to_status": "submitted"},
+            {"id": str(second.id), "from_status": "draft", "to_status": "submitted"},
+            {"id": str(first.id), "from_status": "draft", "to_status": "withdrawn"},
+        ]
+        response = authenticated_client.post(
+            reverse("application-bulk-transition"),
+            {"transitions": transitions},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        assert [r["status"] for r in response.data["results"]] == [
+            "transitioned",
+            "conflict",
+            "error",
+        ]
+        assert StatusHistory.objects.count() == 1